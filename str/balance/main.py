@@ -3,8 +3,12 @@ from datetime import datetime
 import pandas as pd
 from pandas import DataFrame, Period
 
-from str.categories import MONEY_COLS
-from str.database import read_table
+from str.categories import MONEY_COLS, MONEY_COLS_LIST
+from str.database import cached_table
+from str.tool import as_period
+
+# Money columns are kept as one consolidated float64 block for the arithmetic
+MONEY_DTYPES = dict.fromkeys(MONEY_COLS, "float64")
 
 
 def balance(
@@ -19,7 +23,7 @@ def balance(
         - Loads credits, installments, and collections from the database.
         - Restricts installments and collections to those with disbursement/collection
           dates up to the provided cutoff date.
-        - Merges collections onto installments to subtract paid amounts.
+        - Aligns the collected amounts to installments to subtract paid amounts.
         - Returns a DataFrame with updated outstanding capital, interest, IVA, and total.
 
     Parameters
@@ -34,12 +38,12 @@ def balance(
     """
 
     # --- Load database tables ---
-    df_crts = read_table("credits")
-    df_inst = read_table("installments")
-    df_coll = read_table("collections")
+    df_crts = cached_table("credits")
+    df_inst = cached_table("installments")
+    df_coll = cached_table("collections")
 
     # Convert input date to Period for comparison
-    date = Period(date, "D")
+    date = as_period(date)
 
     # --- Merge disbursement date onto installments ---
     df_inst = df_inst.merge(
@@ -47,38 +51,27 @@ def balance(
         left_on="Credit_ID",
         right_index=True,
         how="left",
-    ).copy()
+    )
 
     # Keep only installments from credits disbursed on or before `date`
-    df = df_inst.loc[df_inst["Disbursement_Date"] <= date].copy()
+    # (the merge result is a temporary frame, so this is the only copy)
+    mask = (df_inst["Disbursement_Date"] <= date).to_numpy()
+    df = df_inst.loc[mask].astype(MONEY_DTYPES)
 
-    # Keep only collections up to `date`
+    # Keep only collections up to `date` and aggregate them per installment
     df_coll = df_coll.loc[df_coll["Date"] <= date]
-    df_coll = df_coll.groupby("Installment_ID")[
-        ["Capital", "Interest", "IVA", "Total"]
-    ].sum()
-    # --- Merge collections onto installments ---
-    df = df.merge(
-        df_coll[["Capital", "Interest", "IVA", "Total"]],
-        left_index=True,
-        right_index=True,
-        how="left",
-        suffixes=("", "_Coll"),
+    df_paid = (
+        df_coll.groupby("Installment_ID", sort=False)[MONEY_COLS_LIST]
+        .sum()
+        .apply(pd.to_numeric, errors="coerce")
+        .reindex(df.index, fill_value=0.0)
+        .fillna(0.0)
+        .astype("float64")
     )
     df.index.name = "ID"
-    # --- Subtract collected amounts from installment balances ---
-    for col in MONEY_COLS:
-        # Convert collections to numeric (safely), fill missing with zero
-        df[col + "_Coll"] = pd.to_numeric(df[col + "_Coll"], errors="coerce").fillna(
-            0.0
-        )
-
-        # Subtract collected amount
-        df[col] -= df[col + "_Coll"]
-        df[col] = df[col].round(6)
 
-        # Remove helper column
-        df.drop(columns=[col + "_Coll"], inplace=True)
+    # --- Subtract collected amounts from installment balances ---
+    df[MONEY_COLS_LIST] = (df[MONEY_COLS_LIST].to_numpy() - df_paid.to_numpy()).round(6)
 
     # --- Drop columns not needed in the output ---
     df.drop(
@@ -87,8 +80,12 @@ def balance(
     )
 
     if overdue:
-        for col in ["Interest", "IVA"]:
-            df.loc[df["Due_Date"] > vto, col] = 0
-        df["Total"] = df[["Capital", "Interest", "IVA"]].sum(axis=1)
+        # Drop the interest/IVA not yet due at `vto` and recompute the total
+        # as a plain column addition
+        not_due = (df["Due_Date"] > as_period(vto)).to_numpy()
+        df.loc[not_due, ["Interest", "IVA"]] = 0.0
+        df["Total"] = (
+            df["Capital"].to_numpy() + df["Interest"].to_numpy() + df["IVA"].to_numpy()
+        )
 
     return df
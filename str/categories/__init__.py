@@ -1,5 +1,5 @@
 # categories/__init__.py
-from str.categories.main import Genders, MaritalStatus, DocTypes, CollectionTypes, PhoneTypes, RelationshipsTypes, CreditTypes, MONEY_COLS, IdentificationType
+from str.categories.main import Genders, MaritalStatus, DocTypes, CollectionTypes, PhoneTypes, RelationshipsTypes, CreditTypes, MONEY_COLS, MONEY_COLS_LIST, IdentificationType
 from str.categories.geo_types import Country, Province, City, ProvincesArgentina, CitiesArgentinaBuenosAires, CitiesArgentinaCordoba
 
-__all__ = ['Genders', 'MaritalStatus', 'DocTypes',  'CollectionTypes', 'PhoneTypes', 'RelationshipsTypes', 'CreditTypes', 'IdentificationType', 'MONEY_COLS', 'Country', 'Province', 'City', 'ProvincesArgentina', 'CitiesArgentinaBuenosAires', 'CitiesArgentinaCordoba']
\ No newline at end of file
+__all__ = ['Genders', 'MaritalStatus', 'DocTypes',  'CollectionTypes', 'PhoneTypes', 'RelationshipsTypes', 'CreditTypes', 'IdentificationType', 'MONEY_COLS', 'MONEY_COLS_LIST', 'Country', 'Province', 'City', 'ProvincesArgentina', 'CitiesArgentinaBuenosAires', 'CitiesArgentinaCordoba']
\ No newline at end of file
@@ -5,63 +5,77 @@ df_countries = read_table("countries", "Name")  # tabla de países
 df_provinces = read_table("provinces", "Name")  # tabla de provincias
 df_cities = read_table("cities", "Name")  # tabla de ciudades
 
-geo_types = """#geo_types.py
+# ---------- Join provinces → countries once ----------
+df_geo = (
+    df_provinces.reset_index()
+    .merge(
+        df_countries.reset_index()[["ID", "Name"]],
+        left_on="Country_ID",
+        right_on="ID",
+        suffixes=("", "_Country"),
+        validate="m:1",
+    )
+    .sort_values(by=["Name_Country", "Name"], kind="stable")
+)
+
+# City names of each province (keeps the name order of df_cities)
+cities_by_province = df_cities.groupby("Province_ID").groups
+
+# ---------- Output pieces (joined once at the end) ----------
+geo_types: list[str] = [
+    """#geo_types.py
 from typing import Literal
 
 Country = Literal[
 """
+]
 
-init_prim = """# categories/__init__.py
-from str.categories.main import Genders, MaritalStatus, DocTypes, CollectionTypes, PhoneTypes, RelationshipsTypes, CreditTypes, MONEY_COLS, IdentificationType
+init_prim: list[str] = [
+    """# categories/__init__.py
+from str.categories.main import Genders, MaritalStatus, DocTypes, CollectionTypes, PhoneTypes, RelationshipsTypes, CreditTypes, MONEY_COLS, MONEY_COLS_LIST, IdentificationType
 from str.categories.geo_types import Country, Province, City"""
-init_sec = """__all__ = ['Genders', 'MaritalStatus', 'DocTypes',  'CollectionTypes', 'PhoneTypes', 'RelationshipsTypes', 'CreditTypes', 'IdentificationType', 'MONEY_COLS', 'Country', 'Province', 'City'"""
-for country in df_countries.index.values:
-    geo_types += f"    '{country}',\n"
-geo_types += "    ]\n\n"
-for country in df_countries.index.values:
-    mask = df_provinces["Country_ID"] == df_countries.at[country, "ID"]
-    country_provinces = df_provinces.loc[mask]
-    if not country_provinces.empty:
-        name = f"Provinces{str(country).title().replace(' ', '')}"
-        geo_types += f"{name} = Literal[\n"
-        init_prim += f", {name}"
-        init_sec += f", '{name}'"
-        for province in country_provinces.index.values:
-            geo_types += f"    '{province}',\n"
-        geo_types += "    ]\n"
-geo_types += "\n"
-for country in df_countries.index.values:
-    mask = df_provinces["Country_ID"] == df_countries.at[country, "ID"]
-    country_provinces = df_provinces.loc[mask]
-    if not country_provinces.empty:
-        for province in country_provinces.index.values:
-            mask = df_cities["Province_ID"] == df_provinces.at[province, "ID"]
-            province_cities = df_cities.loc[mask]
-            name = f"Cities{str(country).title().replace(' ', '')}{str(province).title().replace(' ', '')}"
-            geo_types += f"{name} = Literal[\n"
-            init_prim += f", {name}"
-            init_sec += f", '{name}'"
-            for city in province_cities.index.values:
-                geo_types += f"    '{city}',\n"
-            geo_types += "    ]\n"
+]
+init_sec: list[str] = [
+    """__all__ = ['Genders', 'MaritalStatus', 'DocTypes',  'CollectionTypes', 'PhoneTypes', 'RelationshipsTypes', 'CreditTypes', 'IdentificationType', 'MONEY_COLS', 'MONEY_COLS_LIST', 'Country', 'Province', 'City'"""
+]
+geo_types.extend(f"    '{country}',\n" for country in df_countries.index)
+geo_types.append("    ]\n\n")
+for country, country_provinces in df_geo.groupby(
+    "Name_Country", sort=False, observed=True
+):
+    name = f"Provinces{str(country).title().replace(' ', '')}"
+    geo_types.append(f"{name} = Literal[\n")
+    init_prim.append(f", {name}")
+    init_sec.append(f", '{name}'")
+    geo_types.extend(f"    '{province}',\n" for province in country_provinces["Name"])
+    geo_types.append("    ]\n")
+geo_types.append("\n")
+for country, province, province_id in df_geo[["Name_Country", "Name", "ID"]].itertuples(
+    index=False
+):
+    province_cities = cities_by_province.get(province_id, [])
+    name = f"Cities{str(country).title().replace(' ', '')}{str(province).title().replace(' ', '')}"
+    geo_types.append(f"{name} = Literal[\n")
+    init_prim.append(f", {name}")
+    init_sec.append(f", '{name}'")
+    geo_types.extend(f"    '{city}',\n" for city in province_cities)
+    geo_types.append("    ]\n")
 
-geo_types += "\n"
-geo_types += """Province = Literal["""
-for province in df_provinces.index.values:
-    geo_types += f"'{province}',\n"
-geo_types += "    ]\n\n"
+geo_types.append("\n")
+geo_types.append("""Province = Literal[""")
+geo_types.extend(f"'{province}',\n" for province in df_provinces.index)
+geo_types.append("    ]\n\n")
 
-geo_types += """City = Literal["""
-for city in df_cities.index.values:
-    geo_types += f"'{city}',\n"
-geo_types += "    ]\n\n"
+geo_types.append("""City = Literal[""")
+geo_types.extend(f"'{city}',\n" for city in df_cities.index)
+geo_types.append("    ]\n\n")
 
-init_prim += "\n\n"
-init_sec += "]"
+init_prim.append("\n\n")
+init_sec.append("]")
 
 with open("str/categories/geo_types.py", "w", encoding="utf-8") as f:
-    f.write(geo_types)
+    f.write("".join(geo_types))
 
-init = init_prim + init_sec
+init = "".join(init_prim) + "".join(init_sec)
 with open("str/categories/__init__.py", "w", encoding="utf-8") as f:
     f.write(init)
@@ -3,6 +3,28 @@ from __future__ import annotations
 
 from typing import Literal
 
+__all__ = [
+    "COLLECTION_TYPES",
+    "CREDIT_TYPES",
+    "DOC_TYPES",
+    "GENDERS",
+    "IDENTIFICATION_TYPE",
+    "MARITAL_STATUS",
+    "MONEY_COLS",
+    "MONEY_COLS_LIST",
+    "PHONE_TYPES",
+    "RELATIONSHIPS_TYPES",
+    "CollectionTypes",
+    "CreditTypes",
+    "DocTypes",
+    "Genders",
+    "IdentificationType",
+    "MaritalStatus",
+    "MoneyCol",
+    "PhoneTypes",
+    "RelationshipsTypes",
+]
+
 Genders = Literal["NO BINARIO", "MASCULINO", "FEMENINO", "OTRO"]
 GENDERS: tuple[Genders, ...] = ("NO BINARIO", "MASCULINO", "FEMENINO", "OTRO")
 
@@ -52,6 +74,8 @@ RELATIONSHIPS_TYPES: tuple[RelationshipsTypes, ...] = (
 MoneyCol = Literal["Capital", "Interest", "IVA", "Total"]
 
 MONEY_COLS: tuple[MoneyCol, ...] = ("Capital", "Interest", "IVA", "Total")
+# Ready-made list for DataFrame column selection (built once at import)
+MONEY_COLS_LIST: list[MoneyCol] = list(MONEY_COLS)
 
 IdentificationType = Literal["CUIL", "DNI", "Credit_ID", "Origin_ID"]
 
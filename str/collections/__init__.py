@@ -1,5 +1,16 @@
 # collection/__init__.py
-from str.collections.general import individual_collection
-from str.collections.process.massive import collection as massive_collection
+# The collection engine is imported on first access (PEP 562), so importing a
+# submodule such as str.collections.round does not load all of it
+def __getattr__(name: str):
+    if name == "individual_collection":
+        from str.collections.general import individual_collection
+
+        return individual_collection
+    if name == "massive_collection":
+        from str.collections.process.massive import collection as massive_collection
+
+        return massive_collection
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["individual_collection", "massive_collection"]
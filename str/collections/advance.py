@@ -17,7 +17,7 @@
 
 from datetime import datetime
 
-from pandas import DataFrame, Period, concat
+from pandas import DataFrame, Period, Series, concat
 
 # Load balances of installments
 from str.balance import balance
@@ -27,20 +27,26 @@ from str.collections.penalty import new as penalty
 
 # Shared tools for collections: saving, formatting, splitting, etc.
 from str.collections.tools import (
+    _concat,
     _save,
     basic_formatting,
+    drop_future_interest,
     extra_formatting,
-    first_inst,
-    split,
+    first_inst_batch,
+    split_batch,
+    split_first,
 )
 
 # IDs representing advance/bonus collection types
 from str.collections.type_coll import advance_id, bonus_id
 
 # Load collection types table (indexed by "Type")
-from str.database import read_table
+from str.database import cached_table
 
-df_coll_type = read_table("collection_types", "Type")
+# Date normalization helper
+from str.tool import as_period, today
+
+df_coll_type = cached_table("collection_types", "Type")
 
 
 def build_bonus_rows(
@@ -79,27 +85,27 @@ def build_bonus_rows(
     ------------------------------------------------------------
     """
 
-    # Merge original installments with the collected Capital/Interest
-    df_int = df_original.merge(
-        df_result.loc[
-            df_result["Type_ID"] == advance_id,
-            ["Installment_ID", "Capital", "Interest"],
-        ],
-        left_index=True,
-        right_on="Installment_ID",
-        suffixes=["", "_Coll"],
-    )
+    # Collected Capital/Interest of the advance rows, aligned to the
+    # original installments they were applied to
+    df_paid = df_result.loc[
+        df_result["Type_ID"] == advance_id,
+        ["Installment_ID", "Capital", "Interest"],
+    ].set_index("Installment_ID")
+    df_int = df_original.loc[df_original.index.isin(df_paid.index)]
+    df_paid = df_paid.reindex(df_int.index)
 
     # Compute remaining capital/interest after collection
-    df_int["Capital"] -= df_int["Capital_Coll"]
-    df_int["Interest"] -= df_int["Interest_Coll"]
+    capital = df_int["Capital"].to_numpy() - df_paid["Capital"].to_numpy()
+    interest = df_int["Interest"].to_numpy() - df_paid["Interest"].to_numpy()
 
     # Keep only those with zero capital but positive interest (bonus case)
-    df_int = df_int.loc[(df_int["Capital"] == 0.0) & (df_int["Interest"] != 0.0)]
+    mask = (capital == 0.0) & (interest != 0.0)
+    df_int = df_int.loc[mask].copy()
 
-    # Recompute total and assign bonus type
-    df_int["Total"] = df_int[["Capital", "Interest", "IVA"]].sum(axis=1)
-    df_int.drop(columns=["Capital_Coll", "Interest_Coll"], inplace=True)
+    # Store the remaining amounts, recompute total and assign bonus type
+    df_int["Capital"] = capital[mask]
+    df_int["Interest"] = interest[mask]
+    df_int["Total"] = capital[mask] + interest[mask] + df_int["IVA"].to_numpy()
     df_int["Type_ID"] = bonus_id
 
     # Apply the same formatting as the rest of the flows
@@ -113,6 +119,7 @@ def credit(
     amount: float,
     date: str | datetime | Period = Period.now("D"),
     save: bool = False,
+    _round: bool = True,
 ) -> DataFrame:
     """
     ------------------------------------------------------------
@@ -124,7 +131,7 @@ def credit(
       • Loads the credit balance at the given date.
       • Removes future interest/IVA from installments not yet due.
       • Splits the payment into 'covered' installments (df_up),
-        partially covered or uncovered ones (df_down),
+        the next partially covered one (next_inst),
         and calculates any surplus.
       • Creates penalties or next installments when necessary.
       • Builds EXTRA bonus rows when interest disappears
@@ -141,6 +148,8 @@ def credit(
         Date of the transaction.
     save : bool
         Whether to save the result to the database.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
 
     Returns
     -------
@@ -149,42 +158,38 @@ def credit(
     ------------------------------------------------------------
     """
 
+    # Normalize the date once; balance() and the helpers below reuse it
+    date = as_period(date)
+
     # Load the balance and filter only installments of this credit
     df = balance(date)
     df = df.loc[df["Credit_ID"] == credit_id]
 
-    # Copy original DF for later internal-interest comparison
-    df_int = df.copy()
+    # Keep the original rows for later internal-interest comparison
+    df_int = df
 
-    # Remove interest and IVA from future installments
-    for col in ["Interest", "IVA"]:
-        df.loc[df["Due_Date"] > date, col] = 0.0
+    # Remove interest and IVA from future installments (recomputing Total)
+    df = drop_future_interest(df, date)
 
-    # Recompute each installment's total after adjustment
-    df["Total"] = df[["Capital", "Interest", "IVA"]].sum(axis=1)
-
-    # Split payment into fully covered installments (up),
-    # remaining installments (down), and any surplus
-    df_up, df_down, surplus = split(df, amount, advance_id)
+    # Split payment into fully covered installments (up), the next
+    # installment partially paid with the surplus, and any surplus
+    df_up, next_inst, surplus = split_first(df, amount, advance_id)
 
     # Handle surplus cases
     if surplus > 0:
-        if df_down.empty and save:
+        if next_inst.empty and save:
             # Create a penalty installment if allowed
             new_penalty = penalty(credit_id, surplus, date)
-            df = concat([df_up, new_penalty])
-            df.set_index("ID", inplace=True)
+            df = concat([df_up.set_index("ID"), new_penalty])
 
-        elif df_down.empty:
+        elif next_inst.empty:
             # Surplus exists but saving is not allowed -> warn
             df = df_up.copy()
             print(f'❗❗❗ We need to create a "Penalty" for $ {surplus:,.2f}. ❗❗❗')
 
         else:
-            # Partially covered: create/update the next installment
-            next_inst = first_inst(df_down, surplus, advance_id)
-            df = concat([df_up, next_inst])
-            df.set_index("ID", inplace=True)
+            # Partially covered: add the updated next installment
+            df = concat([df_up.set_index("ID"), next_inst])
 
             # Recompute true surplus after applying the next installment
             surplus = amount - df["Total"].sum()
@@ -204,7 +209,97 @@ def credit(
         df = concat([df, df_bonus])
 
     # Save to DB if requested
-    _save(df, date, save)
+    df = _save(df, date, save, _round)
+
+    # Apply any extra formatting before returning
+    df = extra_formatting(df)
+
+    return df
+
+
+def credit_batch(
+    amounts: Series,
+    date: str | datetime | Period | None = None,
+    save: bool = False,
+    _balance: DataFrame | None = None,
+    _round: bool = True,
+) -> DataFrame:
+    """
+    ------------------------------------------------------------
+    credit_batch()
+    ------------------------------------------------------------
+    Apply `credit()` to several credits in a single pass: future
+    interest/IVA is removed once, the split is computed with one
+    grouped running total, bonus rows are built for all credits
+    together and the result is saved once.
+
+    Parameters
+    ----------
+    amounts : Series
+        Money applied to each credit, indexed by Credit_ID.
+    date : str | datetime | Period | None
+        Date of the transaction (today if None).
+    save : bool
+        Whether to save the result to the database.
+    _balance : DataFrame | None
+        Precomputed `balance(date)` snapshot (before removing future
+        interest/IVA) to reuse instead of recomputing it.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
+
+    Returns
+    -------
+    DataFrame
+        The final combined result of all the credits.
+    ------------------------------------------------------------
+    """
+
+    # Normalize the date once (today if None); balance() and the helpers
+    # below reuse it
+    date = today() if date is None else as_period(date)
+
+    # Load the balance and filter only installments of these credits
+    df = balance(date) if _balance is None else _balance
+    df = df.loc[df["Credit_ID"].isin(amounts.index)]
+
+    # Keep the original rows for later internal-interest comparison
+    df_int = df
+
+    # Remove interest and IVA from future installments (recomputing Total)
+    df = drop_future_interest(df, date)
+
+    # Split every payment: covered installments, remaining ones, and surplus per credit
+    df_up, df_down, surplus = split_batch(df, amounts, advance_id)
+
+    # Apply each surplus to the next pending installment of its credit
+    next_inst = first_inst_batch(df_down, surplus, advance_id)
+    dfs = [df_up.set_index("ID"), next_inst]
+
+    # Credits with surplus but no pending installments
+    for credit_id, leftover in surplus.loc[
+        (surplus > 0) & ~surplus.index.isin(next_inst["Credit_ID"])
+    ].items():
+        if save:
+            # Create a penalty installment if allowed
+            dfs.append(penalty(credit_id, leftover, date))
+        else:
+            # Surplus exists but saving is not allowed -> warn
+            print(f'❗❗❗ We need to create a "Penalty" for $ {leftover:,.2f}. ❗❗❗')
+
+    df = _concat(dfs)
+
+    # Format the resulting covered/updated installments
+    df = basic_formatting(df, date)
+
+    # Generate the bonus installments (if any) and append them to the main DataFrame
+    df_bonus = build_bonus_rows(df_int, df, advance_id, bonus_id, date)
+
+    # Merge the newly created bonus rows with the existing result
+    if not df_bonus.empty:
+        df = concat([df, df_bonus])
+
+    # Save to DB if requested
+    df = _save(df, date, save, _round)
 
     # Apply any extra formatting before returning
     df = extra_formatting(df)
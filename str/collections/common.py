@@ -21,7 +21,7 @@
 
 from datetime import datetime
 
-from pandas import DataFrame, Period, concat
+from pandas import DataFrame, Period, Series, concat
 
 # Retrieve the current balance of installments for a given date
 from str.balance import balance
@@ -32,21 +32,27 @@ from str.categories import CollectionTypes, DocTypes
 # Function to generate penalty installments when necessary
 from str.collections.penalty import new as penalty
 
+# Utility for rounding small balances
+from str.collections.round import round_balance
+
 # Helper: retrieve all installments for every credit linked to a document
 # Shared tools for formatting, saving, and installment operations
 from str.collections.tools import (
+    _concat,
     _save,
     basic_formatting,
     extra_formatting,
-    first_inst,
+    first_inst_batch,
     get_client_balance_by_document,
-    split,
+    split_batch,
+    split_first,
 )
 
 # Identifier for common/regular collection type
 from str.collections.type_coll import common_id
 
-# Read tables from the database (clients, credits, etc.)
+# Date normalization helper
+from str.tool import as_period, today
 
 
 def credit(
@@ -54,6 +60,8 @@ def credit(
     amount: float,
     date: str | datetime | Period = Period.now("D"),
     save: bool = False,
+    _balance: DataFrame | None = None,
+    _round: bool = True,
 ) -> DataFrame:
     """
     ------------------------------------------------------------
@@ -65,7 +73,7 @@ def credit(
     The function:
       • Loads the active installments for the given credit/date.
       • Splits the payment into fully covered installments (df_up),
-        pending/remaining installments (df_down), and surplus money.
+        the next pending installment (next_inst), and surplus money.
       • Handles surplus by updating the next installment or creating
         a penalty installment if allowed.
       • Applies standard formatting, optional saving, and final
@@ -81,6 +89,11 @@ def credit(
         Date of the payment.
     save : bool
         Whether new installments (like penalties) should be saved.
+    _balance : DataFrame | None
+        Precomputed `balance(date)` snapshot to reuse instead of
+        recomputing the balance of every installment.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
 
     Returns
     -------
@@ -89,47 +102,126 @@ def credit(
     ------------------------------------------------------------
     """
 
+    # Normalize the date once; balance() and the helpers below reuse it
+    date = as_period(date)
+
     # --- Get current balance of installments for the given date ---
-    df = balance(date)
+    df = balance(date) if _balance is None else _balance
 
     # Keep only installments from this credit and with positive pending balance
     df = df.loc[(df["Credit_ID"] == credit_id) & (df["Total"] > 0.0)]
 
-    # Split payment: fully covered installments, remaining installments, and surplus
-    df_up, df_down, surplus = split(df, amount, common_id)
+    # Split payment: fully covered installments, the next pending installment
+    # partially paid with the surplus, and the surplus itself
+    df_up, next_inst, surplus = split_first(df, amount, common_id)
 
     if surplus > 0:
         # Extra money remains after covering df_up
-        if not df_down.empty:
-            # Apply surplus to the next pending installment
-            next_inst = first_inst(df_down, surplus, common_id)
-
+        if not next_inst.empty:
             # Merge fully covered installments with the partially covered one
-            df = concat([df_up, next_inst])
-            df.set_index("ID", inplace=True)
+            df = concat([df_up.set_index("ID"), next_inst])
 
         elif save:
             # Surplus exists but no pending installments: create a penalty
-            new_penalty = penalty(credit_id, amount)
+            # for the money left over (not the whole payment)
+            new_penalty = penalty(credit_id, surplus)
 
             # Merge fully covered installments with the new penalty installment
-            df = concat([df_up.reset_index(drop=False), new_penalty])
-            df.set_index("ID", inplace=True)
+            df = concat([df_up.set_index("ID"), new_penalty])
 
         else:
-            # Surplus exists but creation of penalty is not allowed
+            # Surplus exists but creation of penalty is not allowed: only the
+            # fully covered installments are collected
             print(f'❗❗❗ We need to create a "Penalty" for $ {surplus:,.2f}. ❗❗❗')
+            df = df_up.set_index("ID")
 
     else:
         # Payment exactly fits the fully covered installments
-        df = df_up.copy()
-        df.set_index("ID", inplace=True)
+        df = df_up.set_index("ID")
+
+    # Apply standard formatting to installments
+    df = basic_formatting(df, date)
+
+    # Save installments if required by the caller
+    df = _save(df, date, save, _round)
+
+    # Apply final formatting (sorting, renaming, cosmetic adjustments)
+    df = extra_formatting(df)
+
+    return df
+
+
+def credit_batch(
+    amounts: Series,
+    date: str | datetime | Period | None = None,
+    save: bool = False,
+    _balance: DataFrame | None = None,
+    _round: bool = True,
+) -> DataFrame:
+    """
+    ------------------------------------------------------------
+    credit_batch()
+    ------------------------------------------------------------
+    Apply `credit()` to several credits in a single pass: every
+    credit receives its own amount, the split is computed with one
+    grouped running total and the result is saved once.
+
+    Parameters
+    ----------
+    amounts : Series
+        Money applied to each credit, indexed by Credit_ID.
+    date : str | datetime | Period | None
+        Date of the payment (today if None).
+    save : bool
+        Whether new installments (like penalties) should be saved.
+    _balance : DataFrame | None
+        Precomputed `balance(date)` snapshot to reuse instead of
+        recomputing the balance of every installment.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
+
+    Returns
+    -------
+    DataFrame
+        The formatted installments of all the credits.
+    ------------------------------------------------------------
+    """
+
+    # Normalize the date once (today if None); balance() and the helpers
+    # below reuse it
+    date = today() if date is None else as_period(date)
+
+    # --- Get current balance of installments for the given date ---
+    df = balance(date) if _balance is None else _balance
+
+    # Keep only installments from these credits and with positive pending balance
+    df = df.loc[df["Credit_ID"].isin(amounts.index) & (df["Total"] > 0.0)]
+
+    # Split every payment: covered installments, remaining ones, and surplus per credit
+    df_up, df_down, surplus = split_batch(df, amounts, common_id)
+
+    # Apply each surplus to the next pending installment of its credit
+    next_inst = first_inst_batch(df_down, surplus, common_id)
+    dfs = [df_up.set_index("ID"), next_inst]
+
+    # Credits with surplus but no pending installments
+    for credit_id, leftover in surplus.loc[
+        (surplus > 0) & ~surplus.index.isin(next_inst["Credit_ID"])
+    ].items():
+        if save:
+            # Create a penalty installment for the remaining money
+            dfs.append(penalty(credit_id, leftover))
+        else:
+            # Surplus exists but creation of penalty is not allowed
+            print(f'❗❗❗ We need to create a "Penalty" for $ {leftover:,.2f}. ❗❗❗')
+
+    df = _concat(dfs)
 
     # Apply standard formatting to installments
     df = basic_formatting(df, date)
 
     # Save installments if required by the caller
-    df = _save(df, date, save)
+    df = _save(df, date, save, _round)
 
     # Apply final formatting (sorting, renaming, cosmetic adjustments)
     df = extra_formatting(df)
@@ -144,6 +236,7 @@ def document(
     amount: float,
     date: str | datetime | Period = Period.now("D"),
     save: bool = False,
+    _round: bool = True,
 ) -> DataFrame:
     """
     ------------------------------------------------------------
@@ -162,14 +255,13 @@ def document(
             - Due_Date
             - Emission_Date (disbursement date)
             - Credit_ID
-      6) Use `split()` to determine:
-            - df_up   → fully covered installments
-            - df_down → remaining installments
-            - surplus → leftover amount at document level
-      7) Use `first_inst()` to partially pay the next installment.
-      8) Aggregate by Credit_ID to know how much goes to each credit.
-      9) For each credit, call `credit()` with its allocated amount.
-     10) If there is leftover surplus, apply it to the last credit.
+      6) Use `split_first()` to determine:
+            - df_up     → fully covered installments
+            - next_inst → next installment, partially paid
+            - surplus   → leftover amount at document level
+      7) Aggregate by Credit_ID to know how much goes to each credit.
+      8) Call `credit_batch()` with every credit's allocated amount.
+      9) If there is leftover surplus, apply it to the last credit.
 
     Parameters
     ----------
@@ -183,30 +275,38 @@ def document(
         Payment date.
     save : bool
         Whether to persist the generated collections.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
 
     Returns
     -------
     DataFrame
-        Concatenation of all collection DataFrames returned by `credit()`.
+        Collection rows of all the credits of the document.
     ------------------------------------------------------------
     """
 
+    # Normalize the date once; balance() and the helpers below reuse it
+    date = as_period(date)
+
     # Load all installments belonging to all credits of this client as of the given date
     df = get_client_balance_by_document(doc, doc_type, date)
 
-    # --- Split payment at document level ---
-    df_up, df_down, surplus = split(df, amount, common_id)
+    # Balance snapshot shared by every credit() call below (already in
+    # due-date order within each credit, so it needs no re-sorting)
+    df_balance = df
+
+    # A single credit receives the whole payment: no need to split and regroup
+    credits_id = df["Credit_ID"].unique()
+    if len(credits_id) == 1:
+        return credit(int(credits_id[0]), amount, date, save, df_balance, _round)
 
-    # Use surplus to partially pay the next installment, if any
-    next_inst = first_inst(df_down, surplus, common_id)
+    # --- Split payment at document level, using the surplus to partially
+    # pay the next installment, if any ---
+    df_up, next_inst, surplus = split_first(df, amount, common_id)
 
     # Combine fully-covered installments with the partially paid one
-    if not (df_up.empty or next_inst.empty):
-        df = concat([df_up, next_inst])
-    elif df_up.empty:
-        df = next_inst.copy()
-    else:
-        df = df_up.copy()
+    # (only the Credit_ID/Total columns are used below, not the index)
+    df = _concat([df_up, next_inst])
 
     # --- Aggregate payment per credit ---
     df = df.groupby("Credit_ID")[["Total"]].sum()
@@ -214,19 +314,25 @@ def document(
     # Recompute surplus after summing per credit
     surplus = amount - df["Total"].sum()
 
-    if collection_type == "COMUN":
-        collection = credit
-    # --- For each credit, call credit() with its allocated amount ---
-    dfs: list[DataFrame] = []
-    for id in df.index:
-        credit_amount: float = df.at[id, "Total"]  # type: ignore
-        dfs.append(credit(id, credit_amount, date, save))
+    # --- Apply every credit's allocated amount in a single batch ---
+    df_coll = credit_batch(df["Total"], date, save, df_balance, _round=False)
 
     # If there is remaining surplus, allocate it to the last credit
+    # (its balance changed if the previous payment was saved); the groupby
+    # index is sorted, so the last credit is the last label
     if surplus > 0:
-        dfs.append(credit(df.index.max(), surplus, date, save))
-
-    # Concatenate all collection DataFrames into a single output
-    df = concat([df for df in dfs])
-
-    return df
+        df_surplus = credit(
+            df.index[-1],
+            surplus,
+            date,
+            save,
+            None if save else df_balance,
+            _round=False,
+        )
+        df_coll = _concat([df_coll, df_surplus])
+
+    # Clean tiny residual balances once, after every credit was saved
+    if save and _round:
+        round_balance(date)
+
+    return df_coll
@@ -14,28 +14,44 @@
 
 from datetime import datetime
 
-from pandas import DataFrame, Period, concat
+from pandas import DataFrame, Period, Series
 
 # Enum definitions for collection types and document types
 from str.categories import CollectionTypes, DocTypes
 from str.collections.advance import credit as advance_coll
+from str.collections.advance import credit_batch as advance_coll_batch
 
 # Credit-level collection handlers
 from str.collections.common import credit as common_coll
+from str.collections.common import credit_batch as common_coll_batch
+
+# Utility for rounding small balances
+from str.collections.round import round_balance
 
 # Core collection utilities:
-#   - split: break payment into fully-covered / pending installments
-#   - first_inst: apply surplus to the next pending installment
-#   - get_client_balance_by_document: retrieve all installments for a document
+#   - split_first / split_batch: break payment(s) into fully-covered installments,
+#     the next installment paid with the surplus, and the surplus
+#   - get_client_balance_by_document(s): retrieve all installments for document(s)
+#   - doc_type: normalize a raw document
 from str.collections.tools import (
-    first_inst,
+    _concat,
+    drop_future_interest,
+    first_inst_batch,
     get_client_balance_by_document,
-    split,
+    get_client_balance_by_documents,
+    split_batch,
+    split_first,
+)
+from str.collections.tools import (
+    doc_type as normalize_doc,
 )
 
 # Identifiers for collection types
 from str.collections.type_coll import advance_id, common_id
 
+# Date normalization helper
+from str.tool import as_period, today
+
 
 def document(
     doc: int | str,
@@ -44,6 +60,7 @@ def document(
     amount: float,
     date: str | datetime | Period = Period.now("D"),
     save: bool = False,
+    _round: bool = True,
 ) -> DataFrame:
     """
     ------------------------------------------------------------
@@ -60,16 +77,17 @@ def document(
       2) Choose the collection function and Type_ID according to
          `collection_type`.
          - For ANTICIPADA: remove future Interest / IVA and recompute Total.
-      3) At document level, split the payment into:
-           - df_up   → fully covered installments
-           - df_down → remaining installments
-           - surplus → leftover amount
-      4) Use `first_inst()` to apply the surplus to the next installment.
-      5) Aggregate the applied amounts per Credit_ID.
-      6) For each credit, call the corresponding collection function
-         (common_coll / advance_coll).
-      7) If there is any remaining surplus, assign it to the last credit.
-      8) Filter out rows with Total == 0 and return the result.
+      3) At document level, split the payment with `split_first()` into:
+           - df_up     → fully covered installments
+           - next_inst → next installment, paid with the surplus
+           - surplus   → leftover amount
+      4) Aggregate the applied amounts per Credit_ID.
+      5) Apply every credit's amount with a single call to the
+         corresponding batch function (common_coll_batch /
+         advance_coll_batch).
+      6) If there is any remaining surplus, assign it to the last credit.
+      7) Return the result (the collection functions never return
+         rows with Total == 0).
 
     Parameters
     ----------
@@ -85,6 +103,8 @@ def document(
         Payment date (snapshot for balances).
     save : bool
         Whether to persist the resulting collections.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
 
     Returns
     -------
@@ -93,44 +113,43 @@ def document(
     ------------------------------------------------------------
     """
 
+    # Normalize the date once; balance() and the helpers below reuse it
+    date = as_period(date)
+
     # Load all installments belonging to all credits of this client as of the given date
     df = get_client_balance_by_document(doc, doc_type, date)
 
+    # Balance snapshot (before any adjustment) shared by the collection calls;
+    # it is already in due-date order within each credit
+    df_balance = df
+
     # ------------------------------------------------------------
     # Choose collection behavior based on collection_type
     # ------------------------------------------------------------
     if collection_type == "COMUN":
         collection = common_coll
+        collection_batch = common_coll_batch
         type_id = common_id
 
     elif collection_type == "ANTICIPADA":
         collection = advance_coll
+        collection_batch = advance_coll_batch
         type_id = advance_id
 
-        # Remove interest and IVA from future installments
-        for col in ["Interest", "IVA"]:
-            df.loc[df["Due_Date"] > date, col] = 0.0
-
-        # Recompute each installment's total after adjustment
-        df["Total"] = df[["Capital", "Interest", "IVA"]].sum(axis=1)
+        # Remove interest and IVA from future installments (recomputing Total)
+        df = drop_future_interest(df, date)
 
     else:
         # Unsupported or unknown collection type
         raise ValueError(f"⚠️⚠️⚠️ {collection_type} is not a valid collection type. ⚠️⚠️⚠️")
 
-    # --- Split payment at document level ---
-    df_up, df_down, surplus = split(df, amount, type_id)
-
-    # Use surplus to partially pay the next installment, if any
-    next_inst = first_inst(df_down, surplus, type_id)
+    # --- Split payment at document level, using the surplus to partially
+    # pay the next installment, if any ---
+    df_up, next_inst, surplus = split_first(df, amount, type_id)
 
     # Combine fully-covered installments with the partially paid one
-    if not (df_up.empty or next_inst.empty):
-        df = concat([df_up, next_inst])
-    elif df_up.empty:
-        df = next_inst.copy()
-    else:
-        df = df_up.copy()
+    # (only the Credit_ID/Total columns are used below, not the index)
+    df = _concat([df_up, next_inst])
 
     # --- Aggregate payment per credit ---
     df = df.groupby("Credit_ID")[["Total"]].sum()
@@ -138,20 +157,137 @@ def document(
     # Recompute surplus after summing per credit
     surplus = amount - df["Total"].sum()
 
-    # --- For each credit, call credit() with its allocated amount ---
-    dfs: list[DataFrame] = []
-    for id in df.index:
-        credit_amount: float = df.at[id, "Total"]  # type: ignore
-        dfs.append(collection(id, credit_amount, date, save))
+    # --- Apply every credit's allocated amount in a single batch ---
+    df_coll = collection_batch(df["Total"], date, save, df_balance, _round=False)
 
     # If there is remaining surplus, allocate it to the last credit
+    # (the groupby index is sorted, so it is the last label)
     if surplus > 0:
-        dfs.append(collection(df.index.max(), surplus, date, save))
+        df_surplus = collection(df.index[-1], surplus, date, save, _round=False)
+        df_coll = _concat([df_coll, df_surplus])
+    df = df_coll
+
+    # Clean tiny residual balances once, after every credit was saved
+    if save and _round:
+        round_balance(date)
+
+    return df
+
+
+def document_batch(
+    amounts: Series,
+    doc_type: DocTypes,
+    collection_type: CollectionTypes,
+    date: str | datetime | Period | None = None,
+    save: bool = False,
+    _round: bool = True,
+) -> DataFrame:
+    """
+    ------------------------------------------------------------
+    document_batch()
+    ------------------------------------------------------------
+    Apply `document()` to several documents at once (e.g. a
+    massive collection file).
+
+    The balances of all the documents are loaded once, the
+    document-level split is computed with one grouped running
+    total, and every credit receives its share through a single
+    batch call. Only documents with money left over after paying
+    all their installments are handled one by one.
+
+    Parameters
+    ----------
+    amounts : Series
+        Payment amount of each document, indexed by the raw
+        document (DNI/CUIL/etc.).
+    doc_type : DocTypes
+        Document type used in the "clients" table.
+    collection_type : CollectionTypes
+        Type of collection ("COMUN" or "ANTICIPADA").
+    date : str | datetime | Period | None
+        Payment date (snapshot for balances); today if None.
+    save : bool
+        Whether to persist the resulting collections.
+    _round : bool
+        Whether to clean tiny residual balances after saving.
+
+    Returns
+    -------
+    DataFrame
+        Collection rows generated for all the documents.
+    ------------------------------------------------------------
+    """
+
+    # Normalize the date once (today if None); balance() and the helpers
+    # below reuse it
+    date = today() if date is None else as_period(date)
+
+    # Normalize the documents (merging amounts of equal documents)
+    amounts = amounts.groupby(
+        amounts.index.map(lambda doc: normalize_doc(doc, doc_type))
+    ).sum()
+
+    # Load the installments of every credit of these clients in one pass
+    df = get_client_balance_by_documents(amounts.index, doc_type, date)
+
+    # Balance snapshot (before any adjustment) shared by the collection calls;
+    # it is already in due-date order within each credit
+    df_balance = df
+
+    # ------------------------------------------------------------
+    # Choose collection behavior based on collection_type
+    # ------------------------------------------------------------
+    if collection_type == "COMUN":
+        collection = common_coll
+        collection_batch = common_coll_batch
+        type_id = common_id
+
+    elif collection_type == "ANTICIPADA":
+        collection = advance_coll
+        collection_batch = advance_coll_batch
+        type_id = advance_id
+
+        # Remove interest and IVA from future installments (recomputing Total)
+        df = drop_future_interest(df, date)
+
+    else:
+        # Unsupported or unknown collection type
+        raise ValueError(f"⚠️⚠️⚠️ {collection_type} is not a valid collection type. ⚠️⚠️⚠️")
+
+    # --- Split every payment at document level ---
+    df_up, df_down, surplus = split_batch(df, amounts, type_id, doc_type)
+
+    # Use each surplus to partially pay the document's next installment
+    next_inst = first_inst_batch(df_down, surplus, type_id, doc_type)
+
+    # --- Aggregate payment per document and credit ---
+    df = _concat([df_up, next_inst]).groupby([doc_type, "Credit_ID"])["Total"].sum()
+
+    # --- Apply every credit's allocated amount in a single batch ---
+    df_coll = collection_batch(
+        df.droplevel(doc_type), date, save, df_balance, _round=False
+    )
+
+    # Recompute each document's surplus after summing per credit
+    paid = df.groupby(level=doc_type).sum()
+    surplus = amounts - paid.reindex(amounts.index, fill_value=0.0)
+    last_credit = df.reset_index().groupby(doc_type)["Credit_ID"].last()
 
-    # Concatenate all collection DataFrames into a single output
-    df = concat([df for df in dfs])
+    # If there is remaining surplus, allocate it to the document's last credit
+    dfs: list[DataFrame] = [df_coll]
+    for doc, doc_surplus in surplus.loc[surplus > 0].items():
+        if doc not in last_credit.index:
+            print(
+                f"❗❗❗ {doc_type} {doc} has no credits for $ {doc_surplus:,.2f}. ❗❗❗"
+            )
+            continue
+        dfs.append(
+            collection(int(last_credit[doc]), doc_surplus, date, save, _round=False)
+        )
+    df = _concat(dfs)
 
-    # Remove rows with zero total (defensive clean-up)
-    df = df.loc[df["Total"] != 0]
+    # Clean tiny residual balances once, after every credit was saved
+    if save and _round:
+        round_balance(date)
 
     return df
@@ -1,5 +1,6 @@
 # collections/general.py
 
+from collections.abc import Callable
 from datetime import datetime
 
 from pandas import DataFrame, Period
@@ -7,18 +8,15 @@ from pandas import DataFrame, Period
 # Retrieve the full installment balance snapshot for a given date
 # Allowed document types (e.g. "DNI", "CUIL")
 from str.categories import CollectionTypes, IdentificationType
-from str.collections.advance import credit as advance
-from str.collections.common import credit as common
-from str.collections.documents import document
 
 # Utility for rounding small balances
 # Database I/O helpers
-from str.database import read_table
+from str.database import cached_table
 
 # CUIL validator (normalizes and checks checksum)
 
 # Lookup table with collection types
-df_coll_type = read_table("collection_types")
+df_coll_type = cached_table("collection_types")
 
 # Standard column names for all collection operations
 coll_columns = [
@@ -31,6 +29,22 @@ coll_columns = [
     "Total",
 ]
 
+# Credit-level handlers by collection type, imported on first use so that
+# importing this module does not load the whole collection engine
+_CREDIT_HANDLERS: dict[str, Callable[..., DataFrame]] = {}
+
+
+def _credit_handler(collection_type: CollectionTypes) -> Callable[..., DataFrame]:
+    if not _CREDIT_HANDLERS:
+        from str.collections.advance import credit as advance
+        from str.collections.common import credit as common
+
+        _CREDIT_HANDLERS.update({"COMUN": common, "ANTICIPADA": advance})
+
+    if collection_type not in _CREDIT_HANDLERS:
+        raise ValueError(f"Unsupported collection type: {collection_type}")
+    return _CREDIT_HANDLERS[collection_type]
+
 
 def individual_collection(
     ident: int | str,
@@ -39,6 +53,7 @@ def individual_collection(
     amount: float,
     date: str | datetime | Period = Period.now("D"),
     save: bool = False,
+    _round: bool = True,
 ) -> DataFrame:
     """
     ------------------------------------------------------------
@@ -73,6 +88,8 @@ def individual_collection(
         Reference date for the operation.
     save : bool, optional
         Whether to persist the result to the database.
+    _round : bool, optional
+        Whether to clean tiny residual balances after saving.
 
     Returns
     -------
@@ -88,16 +105,14 @@ def individual_collection(
 
     # --- Dispatch by identification type ---
     if ident_type in ["DNI", "CUIL"]:
-        df = document(ident, ident_type, collection_type, amount, date, save)  # type: ignore
+        from str.collections.documents import document
+
+        df = document(ident, ident_type, collection_type, amount, date, save, _round)  # type: ignore
 
     elif ident_type == "Credit_ID":
         # Select the correct collection handler
-        if collection_type == "COMUN":
-            df = common(ident, amount, date, save)  # type: ignore
-        elif collection_type == "ANTICIPADA":
-            df = advance(ident, amount, date, save)  # type: ignore
-        else:
-            raise ValueError(f"Unsupported collection type: {collection_type}")
+        credit = _credit_handler(collection_type)
+        df = credit(ident, amount, date, save, _round=_round)  # type: ignore
 
     elif ident_type == "Origin_ID":
         # Placeholder behavior remains unchanged
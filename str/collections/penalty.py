@@ -5,7 +5,7 @@ from datetime import datetime
 from pandas import DataFrame, Period
 
 from str.collections.type_coll import penalty_id
-from str.database import read_table
+from str.database import cached_table
 from str.database.structure import Credit
 
 
@@ -13,13 +13,15 @@ def new(
     credit: int, amount: float, date: str | datetime | Period = Period.now("D")
 ) -> DataFrame:
     # create a penalty credit for the surplus ---
-    df_crts = read_table("credits")
-    df_clts = read_table("clients")
+    df_crts = cached_table("credits")
+    df_clts = cached_table("clients")
 
-    # Get client and organism from original credit
-    id_client = int(df_crts.at[credit, "Client_ID"])  # type: ignore
-    client_cuil = int(df_clts.at[id_client, "CUIL"])  # type: ignore
-    organism_id = int(df_crts.at[credit, "Organism_ID"])  # type: ignore
+    # Get client and organism from original credit (one label lookup per
+    # table, then positional reads)
+    crt_pos = df_crts.index.get_loc(credit)
+    id_client = int(df_crts["Client_ID"].iat[crt_pos])  # type: ignore
+    organism_id = int(df_crts["Organism_ID"].iat[crt_pos])  # type: ignore
+    client_cuil = int(df_clts["CUIL"].iat[df_clts.index.get_loc(id_client)])  # type: ignore
     # Create a new penalty credit for the surplus
     new_penalty = Credit(
         date,
@@ -30,11 +32,9 @@ def new(
         organism_id,
         Emission_Date=date,
     )
-    # Get its installments and prepare them for insertion
+    # Get its installments (with the IDs assigned when Credit() wrote them)
+    # and prepare them for insertion
     new_penalty = new_penalty.Installments.reset_index(drop=False)
-    df_inst = read_table("installments")
-    # Assign ID based on current max index in installments table
-    new_penalty["ID"] = df_inst.index.max()
     new_penalty = new_penalty[
         [
             "ID",
@@ -50,4 +50,4 @@ def new(
     ]
     new_penalty["Type_ID"] = penalty_id
 
-    return new_penalty
+    return new_penalty.set_index("ID")
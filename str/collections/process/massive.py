@@ -6,20 +6,28 @@
 # This module provides tools to:
 #   • Load a massive collection file (Excel/CSV)
 #   • Aggregate collection amounts by identification type
-#   • Dispatch each aggregated entry to the individual
-#     collection engine
+#   • Dispatch all the aggregated entries at once to the
+#     batch collection engines
 #   • Return a detailed DataFrame of processed installments
 # ------------------------------------------------------------
 
 from datetime import datetime
 
-from pandas import DataFrame, Period, concat, read_csv, read_excel
+from pandas import DataFrame, Period, read_csv, read_excel
 
 from str.categories import CollectionTypes, IdentificationType
+from str.collections.advance import credit_batch as advance_coll_batch
+from str.collections.common import credit_batch as common_coll_batch
+from str.collections.documents import document_batch
 from str.collections.general import individual_collection
-from str.database import read_table
+from str.collections.round import round_balance
+from str.collections.tools import _concat
+from str.database import cached_table
 from str.io import select_file
 
+# Leading bytes of Excel workbooks: .xlsx (zip) and legacy .xls (OLE2)
+EXCEL_MAGIC = {b"PK\x03\x04", b"\xd0\xcf\x11\xe0"}
+
 
 def collection(
     collection_type: CollectionTypes,
@@ -31,20 +39,22 @@ def collection(
     ------------------------------------------------------------
     process_massive_collection()
     ------------------------------------------------------------
-    Process a massive collection file and apply collections
-    entry-by-entry using the individual_collection() engine.
+    Process a massive collection file and apply all its
+    collections in a single batch.
 
     Workflow (logic preserved):
       1. Ask the user to select a file (.xlsx or .csv).
-      2. Read the file into a DataFrame.
+      2. Read the identifier and amount columns of the file
+         into a DataFrame (Excel detected by its magic bytes).
       3. Validate that the identification column (ident_type)
          exists in the file.
       4. Group by ident_type and sum the "Monto" column.
-      5. For each identifier:
-             → call individual_collection() with the aggregated
-               amount.
-      6. Concatenate all individual results into a single
-         DataFrame.
+      5. Apply every aggregated amount at once:
+             → DNI / CUIL: document_batch()
+             → Credit_ID: the common/advance credit_batch()
+             → otherwise: individual_collection() per identifier
+      6. When saving, round tiny residual balances once for
+         the whole file.
       7. Enrich the result with installment data from the
          "installments" table (Credit_ID, Inst_Num, Due_Date).
       8. Return a cleaned DataFrame with the most relevant
@@ -84,13 +94,18 @@ def collection(
     if not path:
         raise ValueError("No file selected for massive collection processing.")
 
-    # --- 2) Load file depending on extension ---
-    if path.endswith(".xlsx"):
-        df = read_excel(path)
-    elif path.endswith(".csv"):
-        df = read_csv(path)
+    # --- 2) Load file depending on its content (magic bytes), parsing
+    # only the identifier and amount columns ---
+    with open(path, "rb") as file:
+        head = file.read(4)
+
+    usecols = [ident_type, "Monto"]
+    if head in EXCEL_MAGIC:
+        df = read_excel(path, usecols=lambda col: col in usecols)
+    elif path.lower().endswith(".csv"):
+        df = read_csv(path, usecols=lambda col: col in usecols)
     else:
-        raise ValueError(f"Unsupported file type: {path}. Use .xlsx or .csv.")
+        raise ValueError(f"Unsupported file type: {path}. Use .xlsx, .xls or .csv.")
 
     # --- 3) Validate required columns ---
     if ident_type not in df.columns:
@@ -107,19 +122,43 @@ def collection(
     df = df.groupby(ident_type)[["Monto"]].sum()
     print(f"Total collection amount: $ {df['Monto'].sum():,.2f}")
 
-    # --- 5) Run individual collection for each identifier ---
-    dfs: list[DataFrame] = []
-    for doc in df.index:
-        amount: float = df.at[doc, "Monto"]  # type: ignore
-        dfs.append(
-            individual_collection(doc, ident_type, collection_type, amount, date, save)
+    # --- 5) Run the collection of every identifier in one batch ---
+    amounts = df["Monto"].astype("float64")
+    if ident_type in ["DNI", "CUIL"]:
+        df = document_batch(
+            amounts,
+            ident_type,  # type: ignore
+            collection_type,
+            date,
+            save,
+            _round=False,
         )
 
-    # --- 6) Concatenate all individual results ---
-    df = concat(dfs)
+    elif ident_type == "Credit_ID":
+        amounts.index = amounts.index.astype("int64")
+        if collection_type == "COMUN":
+            df = common_coll_batch(amounts, date, save, _round=False)
+        elif collection_type == "ANTICIPADA":
+            df = advance_coll_batch(amounts, date, save, _round=False)
+        else:
+            raise ValueError(f"Unsupported collection type: {collection_type}")
+
+    else:
+        dfs: list[DataFrame] = []
+        for doc, amount in amounts.items():
+            dfs.append(
+                individual_collection(
+                    doc, ident_type, collection_type, amount, date, save, _round=False
+                )
+            )
+        df = _concat(dfs)
+
+    # --- 6) Clean tiny residual balances once for the whole file ---
+    if save:
+        round_balance(date)
 
     # --- 7) Enrich with installments information ---
-    df_inst = read_table("installments")
+    df_inst = cached_table("installments")
     df = df.merge(
         df_inst[["Credit_ID", "Inst_Num", "Due_Date"]],
         left_on="Installment_ID",
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+import numpy as np
 from pandas import DataFrame, Period
 
 from str.balance import balance
@@ -17,7 +18,8 @@ def round_balance(
 
     This function:
         - Retrieves the current balance of all installments.
-        - Filters installments whose remaining Total is below 0.01 (i.e., rounding dust).
+        - Filters installments whose remaining Total is non-zero but below 0.01 in
+          absolute value (i.e., positive or negative rounding dust).
         - Builds a collection entry to zero out those tiny balances.
         - Optionally saves those entries into the `collections` table.
 
@@ -39,8 +41,11 @@ def round_balance(
     # --- Compute full balance up to today (or the given date) ---
     df = balance(date)
 
-    # Keep only installments whose balance is effectively zero
-    df = df.loc[(df["Total"].abs() != 0) & (df["Total"] < 0.1)]
+    # Keep only installments whose balance is effectively zero (|Total| < 0.01),
+    # masking the raw array to skip index alignment
+    total = df["Total"].to_numpy(dtype="float64")
+    df = df.iloc[(total != 0.0) & (np.abs(total) < 0.01)]
+
     # Prepare index and metadata
     df.index.name = "Installment_ID"
     df.reset_index(drop=False, inplace=True)
@@ -1,9 +1,9 @@
 # collection/type_coll.py
 
-from str.database import read_table
+from str.database import cached_table
 
 # Load collection types (indexed by "Type" for lookup)
-df_coll_type = read_table("collection_types", "Type")
+df_coll_type = cached_table("collection_types", "Type")
 common_id: int = df_coll_type.at["COMUN", "ID"]  # type: ignore
 penalty_id: int = df_coll_type.at["PENALTY", "ID"]  # type: ignore
 round_id: int = df_coll_type.at["REDONDEO", "ID"]  # type: ignore
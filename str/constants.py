@@ -1,4 +1,8 @@
-from str.database.connection import read_table
+from sqlalchemy import text
 
-df_bp = read_table("business_partners")
-OUR_COMPANY_ID = None if df_bp.empty else int(df_bp.index.min())
+from str.database.connection import get_engine
+
+# Only the first business partner ID is needed, not the whole table
+with get_engine().connect() as conn:
+    first_bp_id = conn.execute(text("SELECT MIN(ID) FROM business_partners")).scalar()
+OUR_COMPANY_ID = None if first_bp_id is None else int(first_bp_id)
@@ -1,5 +1,23 @@
 # database/__init__.py
 
-from str.database.connection import read_table, write_table
+from str.database.connection import (
+    cached_ids,
+    cached_lookup,
+    cached_table,
+    exists_id,
+    insert_row,
+    invalidate_table,
+    read_table,
+    write_table,
+)
 
-__all__ = ["read_table", "write_table"]
+__all__ = [
+    "cached_ids",
+    "cached_lookup",
+    "cached_table",
+    "exists_id",
+    "insert_row",
+    "invalidate_table",
+    "read_table",
+    "write_table",
+]
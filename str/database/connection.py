@@ -1,26 +1,57 @@
 # database/connection.py
 import json
-from typing import Literal
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Literal, get_args
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import declarative_base
 
-# Load data from the config.json file
-with open("config/config.json", "r", encoding="utf-8") as file:
-    config = json.load(file)
 
-# Access the values
-user = config["user"]
-password = config["password"]
-host = config["host"]
-database = config["database"]
+@lru_cache(maxsize=1)
+def _config() -> dict:
+    """Connection settings from config/config.json, read on first use."""
+    with open("config/config.json", "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Shared SQLAlchemy engine, created on first use."""
+    config = _config()
+
+    # Access the values
+    user = config["user"]
+    password = config["password"]
+    host = config["host"]
+    database = config["database"]
+
+    # Crea la cadena de conexión
+    connection_string = f"mysql+pymysql://{user}:{password}@{host}/{database}"
+
+    # Crear un motor SQLAlchemy; el pool admite ráfagas de conexiones al
+    # crear muchas filas, y pre_ping/recycle evitan usar conexiones que
+    # MySQL ya cerró por wait_timeout
+    return create_engine(
+        connection_string,
+        pool_size=20,
+        max_overflow=40,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+
+
+def __getattr__(name: str):
+    # ENGINE is built lazily (PEP 562), so importing this module does not
+    # touch config/config.json
+    if name == "ENGINE":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Crea la cadena de conexión
-connection_string = f"mysql+pymysql://{user}:{password}@{host}/{database}"
 
-# Crear un motor SQLAlchemy
-ENGINE = create_engine(connection_string)
 BASE = declarative_base()
 
 Tables = Literal[
@@ -33,44 +64,221 @@ Tables = Literal[
     "provinces",
     "cities",
     "clients",
-    "employer",
+    "business_lines",
+    "organisms",
+    "employers",
     "employers_clients",
+    "phone_types",
+    "relationships",
     "phones",
     "credit_types",
-    "business_lines",
-    "organisms",
+    "line_rates",
     "credits",
     "installments",
     "collection_types",
     "collections",
 ]
 
+# Table names accepted at runtime (the tables of config/structure.sql)
+TABLES: frozenset[str] = frozenset(get_args(Tables))
+
+# Primary/foreign keys are SQL INT (32 bits); documents and external
+# identifiers can be wider and keep a 64-bit integer
+WIDE_ID_COLS = {"origin_id", "dni", "cuil", "cuit"}
+
+# Text values accepted as booleans in object columns
+BOOL_STRINGS = {"1": True, "true": True, "0": False, "false": False}
+
+# Rows fetched per round trip when reading a table
+READ_CHUNKSIZE = 100_000
+
+# Rows per multi-row INSERT when writing a table
+WRITE_CHUNKSIZE = 1_000
+
+# Reference tables with a few rows, read without pd.read_sql
+SMALL_TABLES = frozenset(
+    {
+        "genders",
+        "marital_status",
+        "countries",
+        "provinces",
+        "phone_types",
+        "relationships",
+        "credit_types",
+        "collection_types",
+    }
+)
+
+# Dtypes known from config/structure.sql, applied while reading (DATE →
+# datetime64, DECIMAL → float64, INT keys → Int32, repeated names →
+# category) instead of casting the default object columns afterwards.
+# Every DATE column must be listed: the text() query returns unlisted
+# ones as datetime.date objects, which are not converted to Period[D]
+DATE = "datetime64[ns]"
+MONEY = "float64"
+TABLE_SCHEMAS: dict[str, dict[str, str]] = {
+    # Lookup tables: few distinct names, compared and merged by code
+    "countries": {"ID": "Int32", "Name": "category", "Nationality": "category"},
+    "provinces": {"ID": "Int32", "Name": "category", "Country_ID": "Int32"},
+    "genders": {"ID": "Int32", "Description": "category"},
+    "marital_status": {"ID": "Int32", "Description": "category"},
+    "credit_types": {"ID": "Int32", "Name": "category"},
+    "clients": {
+        "ID": "Int32",
+        "Birth_Date": DATE,
+        "Gender_ID": "Int32",
+        "Marital_Status_ID": "Int32",
+        "City_ID": "Int32",
+        "Status_Date": DATE,
+    },
+    "credits": {
+        "ID": "Int32",
+        "Disbursement_Date": DATE,
+        "First_Due_Date": DATE,
+        "Capital_Requested": MONEY,
+        "Capital": MONEY,
+        "Credit_Type_ID": "Int32",
+        "TNA_C_IVA": MONEY,
+        "Client_ID": "Int32",
+        "Organism_ID": "Int32",
+        "Purchase_ID": "Int32",
+        "Sale_ID": "Int32",
+    },
+    "installments": {
+        "ID": "Int32",
+        "Credit_ID": "Int32",
+        "Owner_ID": "Int32",
+        "Due_Date": DATE,
+        "Capital": MONEY,
+        "Interest": MONEY,
+        "IVA": MONEY,
+        "Total": MONEY,
+        "Settlement_Date": DATE,
+    },
+    "collections": {
+        "ID": "Int32",
+        "Installment_ID": "Int32",
+        "Date": DATE,
+        "Type_ID": "Int32",
+        "Capital": MONEY,
+        "Interest": MONEY,
+        "IVA": MONEY,
+        "Total": MONEY,
+    },
+    # Remaining tables with DATE columns
+    "purchases": {"Date": DATE},
+    "sales": {"Date": DATE},
+    "employers_clients": {"Start_Date": DATE, "End_Date": DATE},
+    "line_rates": {"Start_Date": DATE, "End_Date": DATE},
+}
+
 
 # --- Generic helpers --------------------------------------------------------
-def read_table(table: Tables | str, index_col: str | None = "ID") -> pd.DataFrame:
+def _id_dtype(name: str) -> str:
+    return "Int64" if name in WIDE_ID_COLS else "Int32"
+
+
+def _check_table(table: str) -> None:
+    # Fail before the round trip, and never interpolate an unknown name
+    if table not in TABLES:
+        raise ValueError(f"Unknown table: {table!r}")
+
+
+def _sql_value(value):
+    # The MySQL driver only binds Python scalars, not numpy/pandas ones
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Period):
+        return value.to_timestamp().to_pydatetime()
+    return value
+
+
+def _sql_params(params: dict) -> dict:
+    return {key: _sql_value(value) for key, value in params.items()}
+
+
+def read_table(
+    table: Tables | str,
+    index_col: str | None = "ID",
+    where: dict | None = None,
+    downcast: bool = True,
+) -> pd.DataFrame:
     """
     Read a SQL table into a pandas DataFrame and normalize its dtypes:
       - Datetime columns are converted to Period[D]
       - Empty columns receive a consistent default dtype
-      - ID/DNI/CUIL columns are cast to nullable integer (Int64)
+      - ID columns are cast to nullable Int32, DNI/CUIL/CUIT to Int64
       - Boolean-like columns are converted to boolean (nullable)
+
+    If `where` is given ({column: value}), only the matching rows are
+    fetched, filtering in SQL instead of loading the whole table.
+
+    Rows are streamed in chunks of READ_CHUNKSIZE. Tables listed in
+    TABLE_SCHEMAS get their dtypes at read time.
+
+    With `downcast`, the remaining integer columns (terms, installment
+    numbers, ...) are stored in the narrowest integer dtype that holds
+    their values. IDs keep the Int32/Int64 convention.
     """
 
-    df = pd.read_sql(table, ENGINE)
+    _check_table(table)
+
+    # Dates are parsed by read_sql; the remaining dtypes are applied by it
+    schema = TABLE_SCHEMAS.get(table, {})
+    parse_dates = [col for col, dtype in schema.items() if dtype == DATE]
+    dtypes = {col: dtype for col, dtype in schema.items() if dtype != DATE}
+
+    # Always read through a query: read_sql ignores `dtype` for table names
+    if where:
+        conditions = " AND ".join(f"{col} = :{col}" for col in where)
+        query = text(f"SELECT * FROM {table} WHERE {conditions}")
+        params = _sql_params(where)
+    else:
+        query = text(f"SELECT * FROM {table}")
+        params = None
+
+    if table in SMALL_TABLES:
+        # A handful of rows: build the frame from the records directly,
+        # skipping read_sql's dispatch, inference and chunking
+        with get_engine().connect() as conn:
+            result = conn.execute(query, params)
+            df = pd.DataFrame.from_records(
+                result.fetchall(), columns=list(result.keys())
+            )
+        df = df.astype(dtypes)
+        for col in parse_dates:
+            df[col] = pd.to_datetime(df[col])
+    else:
+        # Stream the rows with a server-side cursor, READ_CHUNKSIZE at a
+        # time, so the driver never buffers the whole result set
+        chunks = pd.read_sql(
+            query,
+            get_engine().execution_options(stream_results=True),
+            params=params,
+            parse_dates=parse_dates or None,
+            dtype=dtypes or None,
+            chunksize=READ_CHUNKSIZE,
+        )
+        df = pd.concat(chunks, ignore_index=True)
+
+        # Chunks with different categories are concatenated as object
+        categories = [col for col, dtype in dtypes.items() if dtype == "category"]
+        if categories:
+            df = df.astype(dict.fromkeys(categories, "category"))
 
-    for col in df.columns:
+    for col, dtype in df.dtypes.items():
         s = df[col]
         name = col.lower()
 
         # 1) Datetime → Period[D]
-        if pd.api.types.is_datetime64_any_dtype(s):
+        if dtype.kind == "M":
             df[col] = s.dt.to_period("D")
             continue
 
         # 2) Completely empty column: assign a consistent dtype
         if s.count() == 0:  # all NaN
-            if col.endswith("ID") or name in {"dni", "cuil", "cuit"}:
-                df[col] = s.astype("Int64")  # nullable integer
+            if col.endswith("ID") or name in WIDE_ID_COLS:
+                df[col] = s.astype(_id_dtype(name))  # nullable integer
 
             elif "name" in name or "address" in name or "email" in name:
                 df[col] = s.astype("object")
@@ -87,37 +295,176 @@ def read_table(table: Tables | str, index_col: str | None = "ID") -> pd.DataFram
             continue
 
         # 3) If column is an ID, DNI, or CUIL → cast to nullable integer
-        if col.endswith("ID") or name in {"dni", "cuil", "cuit"}:
-            df[col] = s.astype("Int64")
+        # (unless it was already read with that dtype)
+        if col.endswith("ID") or name in WIDE_ID_COLS:
+            if dtype != _id_dtype(name):
+                df[col] = s.astype(_id_dtype(name))
             continue
 
-        # 4) Already-boolean columns → leave unchanged
-        if pd.api.types.is_bool_dtype(s) or str(s.dtype) == "boolean":
+        # 4) Already-boolean columns (bool / boolean) → leave unchanged
+        if dtype.kind == "b":
             continue
 
         # 5) Integer columns containing only 0/1 → convert to boolean (nullable)
-        if pd.api.types.is_integer_dtype(s) and set(s.dropna().unique()) <= {0, 1}:
+        # (for integers, a [0, 1] range means only 0/1: two NA-skipping
+        # reductions, with no dropna copy nor hash-based isin)
+        if dtype.kind in "iu" and s.min() >= 0 and s.max() <= 1:
             df[col] = s.astype("boolean")
             continue
 
-        # 6) Object columns that look boolean → convert to boolean (nullable)
-        if pd.api.types.is_object_dtype(s):
-            vals = {str(v).strip().lower() for v in s.dropna().unique()}
-            if vals <= {"0", "1", "true", "false"}:
-                df[col] = (
-                    s.astype(str)
-                    .str.strip()
-                    .str.lower()
-                    .map({"1": True, "true": True, "0": False, "false": False})
-                    .astype("boolean")
-                )
+        # 6) Object (not category) columns that look boolean → boolean (nullable)
+        if dtype.kind == "O" and not isinstance(dtype, pd.CategoricalDtype):
+            values = s.dropna().astype(str).str.strip().str.lower()
+            if values.isin(BOOL_STRINGS).all():
+                df[col] = values.map(BOOL_STRINGS).reindex(s.index).astype("boolean")
                 continue
 
+        # 7) Other integer columns → narrowest integer dtype for their range
+        if downcast and dtype.kind in "iu":
+            df[col] = pd.to_numeric(s, downcast="integer")
+
     df.set_index(index_col, inplace=True)
     df = df.sort_index()
     return df
 
 
-def write_table(df: pd.DataFrame, table: Tables | str) -> None:
+def exists_id(table: Tables | str, **filters) -> int | None:
+    """
+    Return the ID of a row of `table` matching every `column=value` in
+    `filters`, or None if there is none. Only that ID travels over the
+    wire, instead of the whole table.
+    """
+    _check_table(table)
+
+    conditions = " AND ".join(f"{col} = :{col}" for col in filters)
+    query = text(f"SELECT ID FROM {table} WHERE {conditions} LIMIT 1")
+    with get_engine().connect() as conn:
+        row = conn.execute(query, _sql_params(filters)).first()
+    return None if row is None else int(row[0])
+
+
+# Memoized tables, keyed by (table, index_col)
+_TABLE_CACHE: dict[tuple[str, str | None], pd.DataFrame] = {}
+
+
+def cached_table(table: Tables | str, index_col: str | None = "ID") -> pd.DataFrame:
+    """
+    Memoized version of `read_table` for read-heavy paths (balances,
+    collections). The same DataFrame is returned on every call, so callers
+    must treat it as read-only. `write_table` invalidates the written table.
+    """
+    key = (table, index_col)
+    if key not in _TABLE_CACHE:
+        _TABLE_CACHE[key] = read_table(table, index_col)
+    return _TABLE_CACHE[key]
+
+
+# Memoized {ID: value} (and {value: ID}) dicts, keyed by (table, column)
+_LOOKUP_CACHE: dict[tuple[str, str], dict] = {}
+
+
+def cached_lookup(table: Tables | str, column: str) -> dict:
+    """
+    Memoized {ID: value} dict of one column of `table`, for rendering
+    single rows (names of provinces, countries, ...) with plain dict
+    lookups instead of DataFrame `.at` calls. Invalidated with the table.
+    """
+    key = (table, column)
+    if key not in _LOOKUP_CACHE:
+        df = cached_table(table)
+        _LOOKUP_CACHE[key] = dict(zip(df.index.tolist(), df[column].tolist()))
+    return _LOOKUP_CACHE[key]
+
+
+def cached_ids(table: Tables | str, column: str | tuple[str, ...]) -> dict:
+    """
+    Memoized {value: ID} dict of one column of `table` (the inverse of
+    `cached_lookup`), to turn reference names into IDs with one dict lookup.
+    With a tuple of columns the keys are tuples of their values, e.g.
+    `cached_ids("provinces", ("Name", "Country_ID"))[(name, country_id)]`.
+    """
+    key = (table, f"ID by {column}")
+    if key not in _LOOKUP_CACHE:
+        if isinstance(column, tuple):
+            df = cached_table(table)
+            values = zip(*(df[col].tolist() for col in column))
+            _LOOKUP_CACHE[key] = dict(zip(values, df.index.tolist()))
+        else:
+            _LOOKUP_CACHE[key] = {
+                value: id_ for id_, value in cached_lookup(table, column).items()
+            }
+    return _LOOKUP_CACHE[key]
+
+
+def invalidate_table(table: Tables | str | None = None) -> None:
+    """Drop the memoized copies of `table` (of every table if None)."""
+    for cache in (_TABLE_CACHE, _LOOKUP_CACHE):
+        for key in [key for key in cache if table is None or key[0] == table]:
+            del cache[key]
+
+
+def insert_row(table: Tables | str, conn: Connection | None = None, **values) -> int:
+    """
+    Insert a single row (`column=value`) into `table` with one prepared
+    INSERT and return its AUTO_INCREMENT ID. Cheaper than building a
+    one-row DataFrame for `write_table`.
+
+    If `conn` is given, the INSERT joins that open transaction (committed
+    by the caller) instead of running in its own; the caller then calls
+    `invalidate_table(table)` once that transaction commits.
+    """
+    _check_table(table)
+
+    columns = ", ".join(values)
+    params = ", ".join(f":{col}" for col in values)
+    query = text(f"INSERT INTO {table} ({columns}) VALUES ({params})")
+    with get_engine().begin() if conn is None else nullcontext(conn) as cx:
+        new_id = cx.execute(query, _sql_params(values)).lastrowid
+
+    # The memoized copies of this table are now stale (inside the caller's
+    # transaction, only after it commits: the caller invalidates then)
+    if conn is None:
+        invalidate_table(table)
+
+    return int(new_id)
+
+
+def write_table(
+    df: pd.DataFrame, table: Tables | str, conn: Connection | None = None
+) -> pd.Index:
+    """
+    Append `df` to `table` and return the IDs assigned to the new rows.
+
+    The rows go in multi-row INSERTs of WRITE_CHUNKSIZE rows; MySQL assigns
+    each of them consecutive AUTO_INCREMENT values starting at
+    LAST_INSERT_ID(). The returned IDs are only meaningful for tables with
+    an AUTO_INCREMENT "ID" column.
+
+    If `conn` is given, the INSERT joins that open transaction (committed
+    by the caller) instead of running in its own; the caller then calls
+    `invalidate_table(table)` once that transaction commits.
+    """
+    _check_table(table)
+
+    if df.empty:
+        return pd.RangeIndex(0, name="ID")
+
     # Single choke point for persistence
-    df.to_sql(table, ENGINE, index=False, if_exists="append")
+    # (one bounded statement per chunk keeps each packet under
+    # max_allowed_packet; the IDs are read back after every chunk)
+    ids = []
+    with get_engine().begin() if conn is None else nullcontext(conn) as cx:
+        for start in range(0, len(df), WRITE_CHUNKSIZE):
+            chunk = df.iloc[start : start + WRITE_CHUNKSIZE]
+            chunk.to_sql(table, cx, index=False, if_exists="append", method="multi")
+            first_id = int(cx.execute(text("SELECT LAST_INSERT_ID()")).scalar_one())
+            ids.append(np.arange(first_id, first_id + len(chunk), dtype="int64"))
+
+    # The memoized copies of this table are now stale (inside the caller's
+    # transaction, only after it commits: the caller invalidates then)
+    if conn is None:
+        invalidate_table(table)
+
+    if len(ids) == 1:
+        return pd.RangeIndex(first_id, first_id + len(df), name="ID")
+    return pd.Index(np.concatenate(ids), name="ID")
@@ -1,5 +1,6 @@
 # database/create.py.py
 import json
+import sys
 
 import pandas as pd
 from sqlalchemy import text
@@ -13,7 +14,7 @@ from str.categories.main import (
     PHONE_TYPES,
     RELATIONSHIPS_TYPES,
 )
-from str.database.connection import ENGINE, read_table, write_table
+from str.database.connection import get_engine, insert_row, invalidate_table
 from str.database.structure import (
     City,
     Country,
@@ -21,32 +22,35 @@ from str.database.structure import (
 )
 from str.tool import _log, log
 
-# Leer el contenido del archivo .sql
+# Leer el archivo .sql una sola vez, quitar los comentarios y dividirlo en
+# sentencias por ";" (una sentencia puede ocupar varias líneas)
 ruta_sql_structure = "config/structure.sql"
 with open(ruta_sql_structure, "r") as file:
-    sql_script = file.read()
+    sql_script = "".join(line for line in file if not line.lstrip().startswith("--"))
+_STATEMENTS = tuple(
+    statement
+    for statement in (part.strip() for part in sql_script.split(";"))
+    if statement
+)
 
-# Intentar conectar al motor y ejecutar el script SQL
+# Intentar conectar al motor y ejecutar el script SQL con una sola conexión.
+# No es atómico: MySQL confirma implícitamente cada DROP/CREATE DATABASE y
+# CREATE TABLE, así que un error a mitad de camino deja un esquema parcial.
+# Solo la carga de las tablas categóricas (más abajo) es una transacción.
 try:
-    with ENGINE.connect() as connection:
-        # Divide el script completo en sentencias individuales por línea
-        statements = sql_script.split("\n")
+    with get_engine().begin() as connection:
         all_good = True
-        # Ejecuta cada sentencia SQL, ignorando comentarios y líneas vacías
-        for i, statement in enumerate(statements):
-            statement = statement.strip()  # Elimina espacios en blanco
-            if statement and not statement.startswith(
-                "--"
-            ):  # Ignora comentarios y vacíos
-                try:
-                    connection.execute(text(statement))
-                    _log(
-                        f"{i}: {statement}", False
-                    )  # Imprime la sentencia ejecutada con su índice
-                except SQLAlchemyError as e:
-                    all_good = False
-                    _log(f"❌ Error al ejecutar la sentencia {i}: {statement}")
-                    _log(f"    Detalle del error: {e}")
+        # Ejecuta cada sentencia SQL directamente en el driver
+        for i, statement in enumerate(_STATEMENTS):
+            try:
+                connection.exec_driver_sql(statement)
+                _log(
+                    f"{i}: {statement}", False
+                )  # Imprime la sentencia ejecutada con su índice
+            except SQLAlchemyError as e:
+                all_good = False
+                _log(f"❌ Error al ejecutar la sentencia {i}: {statement}")
+                _log(f"    Detalle del error: {e}")
 
     if all_good:
         _log("\n✔️ Base de datos creada correctamente.\n", log)
@@ -59,46 +63,51 @@ except SQLAlchemyError as e:
         f"🚨 Error al conectar con la base de datos o al ejecutar el script completo: {e}"
     )
 
-# Crear DataFrame de los sexos
-df_sexo = pd.DataFrame(GENDERS, columns=["Description"])
-write_table(df_sexo, "genders")
-_log("✔️ Tabla 'genders' actualizada correctamente.\n", log)
-
-# Crear DataFrame de estado civil
-df_estado_civil = pd.DataFrame(MARITAL_STATUS, columns=["Description"])
-write_table(df_estado_civil, "marital_status")
-_log("✔️ Tabla 'marital_status' actualizada correctamente.\n", log)
-
-# Crear DataFrame de tipos de teléfonos
-df_phone_types = pd.DataFrame(PHONE_TYPES, columns=["Name"])
-write_table(df_phone_types, "phone_types")
-_log("✔️ Tabla 'phone_types' actualizada correctamente.\n", log)
-
-# Ceate DataFrame de tipos de relaciones
-df_relationships = pd.DataFrame(RELATIONSHIPS_TYPES, columns=["Name"])
-write_table(df_relationships, "relationships")
-_log("✔️ Tabla 'phone_types' y 'relationships' actualizadas correctamente.\n", log)
-
-# Crear DataFrame de tipos de créditos
-df_ct = pd.DataFrame(CREDIT_TYPES, columns=["Name"])
-write_table(df_ct, "credit_types")
-_log("✔️ Tabla 'credit_types' actualizada correctamente.\n", log)
-
-# Crear DataFrame de tipos de cobranzas
-df_coll = pd.DataFrame(COLLECTION_TYPES, columns=["Type"])
-write_table(df_coll, "collection_types")
-Collection_Types = read_table("collection_types", "Type").sort_values(by="ID")
-_log("✔️ Tabla 'collection_types' actualizada correctamente.\n", log)
-
-# Agregar países
+# Tablas categóricas: (tabla, columna, valores)
+SEEDS = (
+    ("genders", "Description", GENDERS),
+    ("marital_status", "Description", MARITAL_STATUS),
+    ("phone_types", "Name", PHONE_TYPES),
+    ("relationships", "Name", RELATIONSHIPS_TYPES),
+    ("credit_types", "Name", CREDIT_TYPES),
+    ("collection_types", "Type", COLLECTION_TYPES),
+)
+
+# Cargar todas las tablas categóricas en una sola transacción, con un
+# INSERT preparado por tabla
+with get_engine().begin() as connection:
+    for table, column, values in SEEDS:
+        connection.execute(
+            text(f"INSERT INTO {table} ({column}) VALUES (:value)"),
+            [{"value": value} for value in values],
+        )
+        invalidate_table(table)
+        _log(f"✔️ Tabla '{table}' actualizada correctamente.\n", log)
+
+Collection_Types = pd.read_sql(
+    text("SELECT Type, ID FROM collection_types ORDER BY ID"),
+    get_engine(),
+    index_col="Type",
+)
+
+# Agregar el país de la empresa
 arg = Country("Argentina", "ARGENTINO/A")
-arg = Country("Brasil", "Brasilero/a")
-# Agregar una provincia
-prov = Province("Buenos Aires", "Argentina")
-prov = Province("Cordoba", "Argentina")
-# Agregar una ciudad
-city = City("Bahía Blanca", "Buenos Aires", "Argentina")
-city = City("Cordoba", "Cordoba", "Argentina")
+
+
+def seed_demo() -> None:
+    """Datos geográficos de ejemplo (solo con `--demo`)."""
+    # Agregar países
+    Country("Brasil", "Brasilero/a")
+    # Agregar una provincia
+    Province("Buenos Aires", "Argentina")
+    Province("Cordoba", "Argentina")
+    # Agregar una ciudad
+    City("Bahía Blanca", "Buenos Aires", "Argentina")
+    City("Cordoba", "Cordoba", "Argentina")
+
+
+if "--demo" in sys.argv:
+    seed_demo()
 
 # Access the values
 with open("config/owner.json", "r", encoding="utf-8") as file:
@@ -107,13 +116,12 @@ company = company_data["Company_Name"]
 cuil = company_data["CUIL"]
 email = company_data["Email"]
 
-df_bp = read_table("business_partners", "ID")
-df_bp.loc[0] = {
-    "Name": company,
-    "CUIT": cuil,
-    "Email": email,
-    "Initials": "CR",
-    "Active": True,
-}
-write_table(df_bp, "business_partners")
+insert_row(
+    "business_partners",
+    Name=company,
+    CUIT=cuil,
+    Email=email,
+    Initials="CR",
+    Active=True,
+)
 _log(f"✔️ Sistema inicializado correctamente a nombre de {company}.\n", log)
@@ -1,7 +1,7 @@
-from str.database.connection import read_table, write_table
+from str.database.connection import cached_ids, exists_id, insert_row
 from str.database.structure.countries import Country
 from str.database.structure.provinces import Province
-from str.tool import _log, log
+from str.tool import _log, log, normalize_name
 
 
 class City:
@@ -31,39 +31,33 @@ class City:
         """
 
         # ---------- Normalize ----------
-        name = str(name).upper().strip()
-        province = str(province).upper().strip()
+        name = normalize_name(name)
+        province = normalize_name(province)
         table = "cities"
 
         self.Name = name  # city name stored in instance
 
-        # ---------- Load tables ----------
-        df = read_table(table)
-        df_provinces = read_table("provinces")
-        df_countries = read_table("countries", "Name")
-
         # Ask for country if missing
         if country is None:
             country = input("Ingrese el país donde está la ciudad: ")
-        country = str(country).upper().strip()
+        country = normalize_name(country)
+
+        # Names kept for __str__, which then needs no lookups
+        self._province_name = province
+        self._country_name = country
 
-        if country in df_countries.index.values:
-            country_id = df_countries.at[country, "ID"]
+        # Hash lookups on memoized {name: ID} dicts instead of scanning
+        country_ids = cached_ids("countries", "Name")
+        if country in country_ids:
+            country_id = country_ids[country]
         else:
             new_country = Country(country)
             country_id = new_country.ID
 
         # ---------- Province exists with this country? ----------
-        mask = (df_provinces["Name"] == province) & (
-            df_provinces["Country_ID"] == country_id
-        )
-        if len(df_provinces.loc[mask]) == 1:
-            row = df_provinces.loc[mask]
-            self.Province_ID = int(row.index[0])  # take scalar, not Series
-        elif len(df_provinces.loc[mask]) > 1:
-            raise ValueError(
-                f"The province {province} in the country {country} is repeat."
-            )
+        province_ids = cached_ids("provinces", ("Name", "Country_ID"))
+        if (province, country_id) in province_ids:
+            self.Province_ID = province_ids[(province, country_id)]
         else:
             # Create province → will also create country if needed
             print(province, country)
@@ -72,26 +66,21 @@ class City:
             self.Province_ID = new_province.ID
 
         # ---------- Insert new city ----------
-        if name not in df.loc[df["Province_ID"] == self.Province_ID, "Name"].values:
+        self.ID = exists_id(table, Name=self.Name, Province_ID=self.Province_ID)
+        if self.ID is None:
             _log("\n✏️ Adding a new city...", log)
 
-            df = df.iloc[0:0]  # empty frame to insert
-            df.loc[0] = {
-                "Name": self.Name,
-                "Province_ID": self.Province_ID,  # FK to provinces table
-            }
-
-            write_table(df, table)
+            self.ID = insert_row(  # store City ID
+                table,
+                Name=self.Name,
+                Province_ID=self.Province_ID,  # FK to provinces table
+            )
             _log(f"    ✅ {name} added to the database.\n", log)
 
         # ---------- City already exists ----------
         else:
             _log(f"✅ {name} already in the database.\n", log)
 
-        # Reload indexed by Name for lookup
-        df = read_table(table, "Name")
-        self.ID = df.at[self.Name, "ID"]  # store City ID
-
     def __str__(self):
         """
         --------------------------------------------------------
@@ -100,17 +89,9 @@ class City:
           Shows city name, its province and its country.
         --------------------------------------------------------
         """
-        df_provinces = read_table("provinces")
-        df_countries = read_table("countries")
-
-        province_name = df_provinces.at[self.Province_ID, "Name"]  # type: ignore
-        country_name = df_countries.at[
-            df_provinces.at[self.Province_ID, "Country_ID"], "Name"  # type: ignore
-        ]
-
         return (
             f"\nℹ️ City ID: {self.ID:03d}\n"
             f"    ➡️ Name: {self.Name}\n"
-            f"    ➡️ Province: {province_name}\n"
-            f"    ➡️ Country: {country_name}\n"
+            f"    ➡️ Province: {self._province_name}\n"
+            f"    ➡️ Country: {self._country_name}\n"
         )
@@ -1,5 +1,18 @@
-from str.database.connection import read_table
+from sqlalchemy import text
+
+from str.database.connection import get_engine
 from str.database.structure.cities.main import City
+from str.tool import normalize_name
+
+# Consulta compilada una sola vez; LIMIT 2 alcanza para distinguir
+# coincidencia única de duplicados
+SEARCH_QUERY = text(
+    "SELECT c.ID FROM cities c"
+    " JOIN provinces p ON c.Province_ID = p.ID"
+    " JOIN countries k ON p.Country_ID = k.ID"
+    " WHERE c.Name = :city AND p.Name = :province AND k.Name = :country"
+    " LIMIT 2"
+)
 
 
 def search_id(
@@ -15,8 +28,8 @@ def search_id(
       el ID de la ciudad en la base de datos.
 
       - Normaliza las entradas (mayúsculas, sin espacios).
-      - Hace merge de cities → provinces → countries.
-      - Filtra la fila exacta ciudad/provincia/país.
+      - Busca la fila exacta ciudad/provincia/país con un JOIN
+        cities → provinces → countries en SQL (solo viajan los IDs).
       - Devuelve el ID en caso de coincidencia única.
       - Lanza error si no existe o si hay más de una coincidencia.
     ============================================================
@@ -25,36 +38,25 @@ def search_id(
     if isinstance(city, City):
         return city.ID  # type: ignore
 
-    # ---------- Load tables ----------
-    cities = read_table("cities")  # tabla de ciudades
-    provinces = read_table("provinces")  # tabla de provincias
-    countries = read_table("countries")  # tabla de países
-
     # ---------- Normalize inputs ----------
-    city = city.upper().strip()
-    province = province.upper().strip()
-    country = country.upper().strip()
+    city = normalize_name(city)
+    province = normalize_name(province)
+    country = normalize_name(country)
 
-    # ---------- Join cities → provinces → countries ----------
-    merged = cities.merge(
-        provinces, left_on="Province_ID", right_index=True, suffixes=("", "_Province")
-    ).merge(
-        countries, left_on="Country_ID", right_index=True, suffixes=("", "_Country")
-    )
-
-    # ---------- Build mask for exact match ----------
-    mask = (
-        (merged["Name"] == city)
-        & (merged["Name_Province"] == province)
-        & (merged["Name_Country"] == country)
-    )
-
-    matches = merged.loc[mask]
+    # ---------- Join cities → provinces → countries (exact match) ----------
+    with get_engine().connect() as conn:
+        matches = (
+            conn.execute(
+                SEARCH_QUERY, {"city": city, "province": province, "country": country}
+            )
+            .scalars()
+            .all()
+        )
 
     # ---------- Return or raise ----------
     if len(matches) == 1:
-        # Devuelve el índice que es el ID de la ciudad
-        return int(matches.index[0])
+        # Devuelve el ID de la ciudad
+        return int(matches[0])
     elif len(matches) == 0:
         new_city = City(city, province, country)
         city_id = int(new_city.ID)  # type: ignore
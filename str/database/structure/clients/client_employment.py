@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pandas import DataFrame, Period
 
-from str.database.connection import read_table, write_table
+from str.database.connection import cached_ids, cached_table, insert_row
 from str.database.structure import Client, Employer, get_employer_id, search_client_id
 
 
@@ -33,31 +33,26 @@ class Client_Employment:
         self.Income = Monthly_Income
         self.Start = Start_Date
         self.End = End_Date
+        self._str: str | None = None  # cached __str__ text
 
-        df = read_table(table)
-        mask = (df["Employer_ID"] == self.Employer_ID) & (
-            df["Client_ID"] == self.Client_ID
-        )
-        if df.loc[mask].empty:
-            df = self._to_dataframe()
-            write_table(df, table)
-            df = read_table(table)
-            mask = (df["Employer_ID"] == self.Employer_ID) & (
-                df["Client_ID"] == self.Client_ID
-            )
+        # Memoized {(Employer_ID, Client_ID): ID}; insert_row invalidates it
+        employment_ids = cached_ids(table, ("Employer_ID", "Client_ID"))
+        self.ID = employment_ids.get((self.Employer_ID, self.Client_ID))
+        if self.ID is None:
+            self.ID = insert_row(table, **self._to_dict())
         else:
             print("Codear la actualización!!!!")
 
-        if len(df.loc[mask]) == 1:
-            self.ID = df.loc[mask].index.values[0]
-        else:
-            raise ValueError("Gandalf fill")
-
     def __str__(self):
-        df_clients = read_table("clients")
+        # The names do not change: build the text once per instance
+        if self._str is not None:
+            return self._str
+
+        df_clients = cached_table("clients")
         last_name = df_clients.at[self.Client_ID, "Last_Name"]
         first_name = df_clients.at[self.Client_ID, "First_Name"]
         CUIL = df_clients.at[self.Client_ID, "CUIL"]
-        df_employers = read_table("employers")
+        df_employers = cached_table("employers")
         employer = df_employers.at[self.Employer_ID, "Employer"]  # type: ignore
-        return f"El empleado {last_name}, {first_name} (CUIL {CUIL}), trabaja en {employer}{'.' if not str(employer).endswith('.') else ''}"
+        self._str = f"El empleado {last_name}, {first_name} (CUIL {CUIL}), trabaja en {employer}{'.' if not str(employer).endswith('.') else ''}"
+        return self._str
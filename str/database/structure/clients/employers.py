@@ -1,9 +1,10 @@
 import pandas as pd
 
-from str.database.connection import read_table, write_table
+from str.database.connection import exists_id, insert_row
 from str.database.structure import City, search_city_id
 from str.database.structure.clients.tool import validate_cuil
 from str.database.structure.organisms import search_organism_id
+from str.tool import normalize_name
 
 
 class Employer:
@@ -59,18 +60,12 @@ class Employer:
         self.City_ID = search_city_id(City)
         self.Address = None if Address is None else str(Address).strip()
         self.Organism_ID = search_organism_id(Organism)
-        # Read current employers indexed by CUIT
-        df = read_table(table, index_col="CUIT")
-
-        if self.CUIT in df.index.values:
-            # Employer already exists → get its ID
-            self.ID = df.at[self.CUIT, "ID"]
-        else:
-            # Employer does not exist → insert and reload
-            new_row = self._to_dataframe()
-            write_table(new_row, table)
-            df = read_table(table, index_col="CUIT")
-            self.ID = df.at[self.CUIT, "ID"]
+        # Look the CUIT up in SQL (only the ID travels over the wire)
+        self.ID = exists_id(table, CUIT=str(self.CUIT))
+
+        if self.ID is None:
+            # Employer does not exist → insert (the INSERT returns its ID)
+            self.ID = insert_row(table, **self._to_dict())
 
     def __str__(self) -> str:
         """Human-readable representation of the employer."""
@@ -87,12 +82,17 @@ def get_employer_id(employer: int | str | Employer):
 
     if isinstance(employer, int):
         cuit = validate_cuil(employer)
-        df = read_table("employers", "CUIT")
-        return df.at[cuit, "ID"]
+        employer_id = exists_id("employers", CUIT=str(cuit))
+        if employer_id is None:
+            raise KeyError(f"CUIT {cuit} not found in 'employers' table.")
+        return employer_id
 
     elif isinstance(employer, str):
-        df = read_table("employers", "Employer")
-        return df.at[employer.upper().strip(), "ID"]
+        name = normalize_name(employer)
+        employer_id = exists_id("employers", Employer=name)
+        if employer_id is None:
+            raise KeyError(f"Employer {name} not found in 'employers' table.")
+        return employer_id
 
     elif isinstance(employer, Employer):
         return employer.ID
@@ -1,13 +1,61 @@
 from datetime import datetime
+from functools import lru_cache
 
 from pandas import DataFrame, Period
+from sqlalchemy import text
 
 from str.categories import City, Genders, MaritalStatus
-from str.database.connection import read_table, write_table
+from str.database.connection import (
+    cached_ids,
+    cached_lookup,
+    get_engine,
+    insert_row,
+)
 from str.database.structure.clases import Email
 from str.database.structure.clients.tool import validate_dni_cuil
 from str.tool import _log, log
 
+# One round trip for both unique keys; the CUIL match takes precedence
+LOOKUP_QUERY = text(
+    "SELECT ID FROM clients WHERE CUIL = :cuil OR DNI = :dni "
+    "ORDER BY CUIL = :cuil DESC LIMIT 1"
+)
+
+
+def _lookup_client(dni: int, cuil: int) -> int | None:
+    """Return the ID of the client with this CUIL or DNI, if any."""
+    # DNI/CUIL are VARCHAR: bound as text so MySQL can use their UNIQUE indexes
+    with get_engine().connect() as conn:
+        row = conn.execute(LOOKUP_QUERY, {"dni": str(dni), "cuil": str(cuil)}).first()
+    return None if row is None else int(row[0])
+
+
+# City → province → country names, resolved in one JOIN
+LOCATION_QUERY = text(
+    "SELECT c.ID, c.Name, p.Name, co.Name FROM cities c "
+    "JOIN provinces p ON c.Province_ID = p.ID "
+    "JOIN countries co ON p.Country_ID = co.ID"
+)
+
+
+@lru_cache(maxsize=1)
+def _city_locations() -> dict[int, tuple[str, str, str]]:
+    """{City ID: (city, province, country)} for every city."""
+    with get_engine().connect() as conn:
+        rows = conn.execute(LOCATION_QUERY).all()
+    return {
+        int(id_): (city, province, country) for id_, city, province, country in rows
+    }
+
+
+def _city_location(city_id: int) -> tuple[str, str, str]:
+    locations = _city_locations()
+    if city_id not in locations:
+        # A city added after the map was built: rebuild it once
+        _city_locations.cache_clear()
+        locations = _city_locations()
+    return locations[city_id]
+
 
 class Client:
     def _to_dict(self):
@@ -46,17 +94,16 @@ class Client:
     ):
         table = "clients"
         DNI, CUIL = validate_dni_cuil(DNI, CUIL)
-        df = read_table(table, "CUIL")
 
         self.Last_Name = Last_Name
         self.First_Name = First_Name
         self.DNI = DNI
         self.CUIL = CUIL
         self.Birth_Date = Birth_Date
-        df_genders = read_table("genders", "Description")
-        self.Gender_ID = df_genders.at[Gender, "ID"]
-        df_martial_status = read_table("marital_status", "Description")
-        self.Marital_Status_ID = df_martial_status.at[Marital_Status, "ID"]
+        self.Gender_ID = cached_ids("genders", "Description")[Gender]
+        self.Marital_Status_ID = cached_ids("marital_status", "Description")[
+            Marital_Status
+        ]
         self.City_ID = City_.ID  # type: ignore
         self.Address = Address
         self.Additional_Addresses = Additional_Addresses
@@ -64,18 +111,20 @@ class Client:
         self.Status_Date = Period.now("D")
         self.Active = True
 
-        if (CUIL not in df.index.values) and (DNI not in df["DNI"].values):
+        # Existence check in SQL, by CUIL or DNI in a single query
+        client_id = _lookup_client(DNI, CUIL)
+
+        if client_id is None:
             _log("\n✏️ Adding a new client...", log)
-            df = self._to_dataframe()
-            write_table(df, table)
-            df = read_table(table, "CUIL")
+            # The INSERT returns the new ID: no lookup after writing
+            client_id = insert_row(table, **self._to_dict())
             _log("    ✅ The new client is added to the database.\n", log)
         else:
             print("Codear la actualización!!!!")
             _log(
                 f"✅ The CUIL {CUIL} and the DNI {DNI} already in the database.\n", log
             )
-        self.ID: int = df.at[CUIL, "ID"]  # type: ignore
+        self.ID: int = client_id  # type: ignore
 
     def __str__(self):
         """
@@ -88,21 +137,12 @@ class Client:
         --------------------------------------------------------
         """
         # --- Load descriptive values ---
-        df_genders = read_table("genders")
-        gender_desc = df_genders.at[self.Gender_ID, "Description"]  # type: ignore
-
-        df_marital = read_table("marital_status")
-        marital_desc = df_marital.at[self.Marital_Status_ID, "Description"]  # type: ignore
-
-        df_cities = read_table("cities")
-        df_provinces = read_table("provinces")
-        df_countries = read_table("countries")
+        gender_desc = cached_lookup("genders", "Description")[self.Gender_ID]
+        marital_desc = cached_lookup("marital_status", "Description")[
+            self.Marital_Status_ID
+        ]
 
-        city_name = df_cities.at[self.City_ID, "Name"]
-        province_id = df_cities.at[self.City_ID, "Province_ID"]
-        province_name = df_provinces.at[province_id, "Name"]  # type: ignore
-        country_id = df_provinces.at[province_id, "Country_ID"]  # type: ignore
-        country_name = df_countries.at[country_id, "Name"]  # type: ignore
+        city_name, province_name, country_name = _city_location(self.City_ID)
 
         # --- Format output ---
         return (
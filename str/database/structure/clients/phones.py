@@ -1,7 +1,7 @@
 from pandas import DataFrame
 
 from str.categories import PhoneTypes, RelationshipsTypes
-from str.database.connection import read_table, write_table
+from str.database.connection import cached_ids, exists_id, insert_row
 from str.database.structure import Client, search_client_id
 
 
@@ -26,22 +26,15 @@ class ClientPhones:
     ):
         self.client_id = search_client_id(Client)
         self.Number = Number
-        df_phone_types = read_table("phone_types", "Name")
-        df_relationships = read_table("relationships", "Name")
-        self.Type_ID = df_phone_types.at[Type, "ID"]
-        self.Relationship_ID = df_relationships.at[Relationship, "ID"]
+        self.Type_ID = cached_ids("phone_types", "Name")[Type]
+        self.Relationship_ID = cached_ids("relationships", "Name")[Relationship]
 
         table = "phones"
-        df = read_table(table)
-        new_phone = self._to_dataframe()
-        mask = (df["Client_ID"] == self.client_id) & (df["Number"] == self.Number)
-        if df.loc[mask].empty:
-            write_table(new_phone, table)
-            df = read_table(table)
-            mask = (df["Client_ID"] == self.client_id) & (df["Number"] == self.Number)
-            self.ID = df.loc[mask].index[0]
-        else:
-            self.ID = df.loc[mask].index[0]
+        key = {"Client_ID": self.client_id, "Number": self.Number}
+        self.ID = exists_id(table, **key)
+        if self.ID is None:
+            # The INSERT returns the new ID: no lookup after writing
+            self.ID = insert_row(table, **self._to_dict())
 
     def __str__(self):
         return f"📞 Phone(ID={self.ID}, Client={self.client_id}, Number={self.Number})"
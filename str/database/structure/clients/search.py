@@ -1,8 +1,9 @@
 # database/structure/clients/search.py
 
-from str.database.connection import read_table
+from str.database.connection import exists_id
 from str.database.structure.clients import Client
 from str.database.structure.clients.tool import validate_cuil
+from str.tool import digits_only
 
 
 def search_id(value: int | str | Client) -> int:
@@ -24,14 +25,18 @@ def search_id(value: int | str | Client) -> int:
     # 2) Normalize to string for analysis
     text = str(value).strip()
 
-    # Extract only digits (handles '20-36329758-8', '  38522111 ', etc.)
-    digits = "".join(ch for ch in text if ch.isdigit())
+    # Plain ASCII digits (the usual input) need no further scanning
+    if text.isascii() and text.isdigit():
+        digits = text
+    else:
+        # If it has letters, we treat it as "name-like" and reject
+        if any(ch.isalpha() for ch in text):
+            raise ValueError(
+                f"Expected DNI/CUIL or Client instance, but got a name-like value: {value!r}"
+            )
 
-    # If it has letters, we treat it as "name-like" and reject
-    if any(ch.isalpha() for ch in text):
-        raise ValueError(
-            f"Expected DNI/CUIL or Client instance, but got a name-like value: {value!r}"
-        )
+        # Extract only digits (handles '20-36329758-8', '  38522111 ', etc.)
+        digits = digits_only(text)
 
     if not digits:
         raise ValueError(
@@ -41,18 +46,19 @@ def search_id(value: int | str | Client) -> int:
     # 3) DNI: usually 7 or 8 digits
     if len(digits) in (7, 8):
         dni = int(digits)
-        df = read_table("clients", "DNI")
-        if dni not in df.index:
+        # DNI/CUIL are VARCHAR: compared as text so the UNIQUE index is used
+        client_id = exists_id("clients", DNI=str(dni))
+        if client_id is None:
             raise KeyError(f"DNI {dni} not found in 'clients' table.")
-        return int(df.at[dni, "ID"])  # type: ignore
+        return client_id
 
     # 4) CUIL/CUIT: 11 digits + validation
     if len(digits) == 11:
         cuil = validate_cuil(digits)  # assume this returns normalized CUIL
-        df = read_table("clients", "CUIL")
-        if cuil not in df.index:
+        client_id = exists_id("clients", CUIL=str(cuil))
+        if client_id is None:
             raise KeyError(f"CUIL {cuil} not found in 'clients' table.")
-        return int(df.at[cuil, "ID"])  # type: ignore
+        return client_id
 
     # 5) Anything else: doesn't match DNI or CUIL
     raise ValueError(
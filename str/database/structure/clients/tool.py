@@ -1,43 +1,49 @@
-from str.database.connection import read_table
+from sqlalchemy import text
+
+from str.database.connection import get_engine
+from str.tool import digits_only
+
+# Weights of the CUIT/CUIL check digit (mod 11)
+CUIL_WEIGHTS = (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
+
+# Stored CUIL of a DNI, if the client exists (DNI is VARCHAR: bind it as
+# text so the UNIQUE index is used)
+CUIL_BY_DNI = text("SELECT CUIL FROM clients WHERE DNI = :dni LIMIT 1")
 
 
 def validate_cuil(doc: str | int) -> int:
-    s = "".join(ch for ch in str(doc) if ch.isdigit())
+    s = digits_only(doc)
     if len(s) != 11:
         raise ValueError(f"⚠️⚠️⚠️ {doc} no es un CUIT/CUIL. ⚠️⚠️⚠️")
 
-    weights = [5, 4, 3, 2, 7, 6, 5, 4, 3, 2]
-    digits = [int(ch) for ch in s]
-    suma = 0
-    for i, w in enumerate(weights):
-        suma += digits[i] * w
+    suma = sum(int(ch) * w for ch, w in zip(s, CUIL_WEIGHTS))
     mod = suma % 11
     check = 11 - mod
     if check == 11:
         check = 0
     elif check == 10:
         check = 9
+    if check != int(s[10]):
+        raise ValueError(f"⚠️⚠️⚠️ {doc} no es un CUIT/CUIL válido. ⚠️⚠️⚠️")
     return int(s)
 
 
 def validate_dni_cuil(dni: str | int, cuil: str | int) -> tuple[int, int]:
     cuil = validate_cuil(cuil)
-    dni = "".join(ch for ch in str(dni) if ch.isdigit())
+    dni = digits_only(dni)
     if len(dni) > 8:
         raise ValueError(f"⚠️⚠️⚠️ {dni} no es un DNI. ⚠️⚠️⚠️")
     else:
         dni = int(dni)
 
     if dni == cuil // 10 % 10**8:
-        df = read_table("clients", "DNI")
-        try:
-            CUIL_DB = df.at[str(dni), "CUIL"]
-            if str(cuil) != CUIL_DB:
-                raise ValueError(
-                    f"⚠️⚠️⚠️ The CUIL {cuil} and the DNI {dni} do not match with the database. ⚠️⚠️⚠️"
-                )
-        except KeyError:
-            pass
+        # Keyed query for the stored CUIL, instead of reading every client
+        with get_engine().connect() as conn:
+            CUIL_DB = conn.execute(CUIL_BY_DNI, {"dni": str(dni)}).scalar()
+        if CUIL_DB is not None and int(CUIL_DB) != cuil:
+            raise ValueError(
+                f"⚠️⚠️⚠️ The CUIL {cuil} and the DNI {dni} do not match with the database. ⚠️⚠️⚠️"
+            )
 
         return dni, cuil
     else:
@@ -1,5 +1,5 @@
-from str.database.connection import read_table, write_table
-from str.tool import _log, log
+from str.database.connection import cached_lookup, exists_id, insert_row
+from str.tool import _log, log, normalize_name
 
 
 class Country:
@@ -26,30 +26,28 @@ class Country:
         """
 
         table = "countries"  # target SQL table
-        df = read_table(table)  # load table into df
 
         # Normalize the given name
-        name = str(name).upper().strip()
+        name = normalize_name(name)
+
+        # Existence check in SQL (only the ID travels over the wire)
+        country_id = exists_id(table, Name=name)
 
         # ========== Country NOT in database ==========
-        if name not in df["Name"].values:
+        if country_id is None:
             _log("\n✏️ Adding a new country...", log)
 
-            df = df.iloc[0:0]  # empty frame for insertion
             self.Name = name  # store normalized name
 
             # Nationality from parameter or user input
             self.Nationality = (
-                input("Ingrese la nacionalidad: ").upper().strip()
+                normalize_name(input("Ingrese la nacionalidad: "))
                 if nationality is None
-                else str(nationality).upper().strip()
+                else normalize_name(nationality)
             )
 
-            # Insert row
-            df.loc[0] = {"Name": self.Name, "Nationality": self.Nationality}
-
-            write_table(df, table)  # write into SQL
-            df = read_table(table, "Name")  # reload indexed by Name
+            # Insert row into SQL (the INSERT returns its ID)
+            self.ID = insert_row(table, Name=self.Name, Nationality=self.Nationality)
 
             _log(f"    ✅ {name} added to the database.\n", log)
 
@@ -57,12 +55,9 @@ class Country:
         else:
             _log(f"\n✅ {name} already in the database.\n", log)
 
-            df = read_table(table, "Name")  # reload indexed by Name
             self.Name = name  # keep normalized
-            self.Nationality = df.at[name, "Nationality"]  # read stored value
-
-        # Always retrieve ID at the end
-        self.ID = df.at[name, "ID"]  # load SQL ID
+            self.Nationality = cached_lookup(table, "Nationality")[country_id]
+            self.ID = country_id  # SQL ID
 
     def __str__(self):
         """
@@ -3,36 +3,41 @@ from datetime import datetime
 from pandas import DataFrame, Period
 
 from str.categories import CreditTypes
-from str.database.connection import read_table, write_table
+from str.database.connection import (
+    cached_ids,
+    exists_id,
+    get_engine,
+    insert_row,
+    invalidate_table,
+)
 from str.database.structure import (
     Client,
     search_client_id,
 )
-from str.database.structure.installments import Installment
+from str.database.structure.installments import create_installments
 from str.database.structure.organisms import Organism, search_organism_id
-from str.tool import _log, log
+from str.tool import _log, log, today
 
 
 class Credit:
+    def _to_dict(self) -> dict:
+        return {
+            "Origin_ID": self.Origin_ID,
+            "Disbursement_Date": self.Emission_Date,
+            "First_Due_Date": self.Due_Date,
+            "Capital_Requested": self.Capital_Requested,
+            "Capital": self.Capital,
+            "Credit_Type_ID": self.Credit_Type,
+            "TNA_C_IVA": self.TNA_C_IVA,
+            "Term": self.Term,
+            "Client_ID": self.Client_ID,
+            "Organism_ID": self.Organism_ID,
+            "Purchase_ID": None,
+            "Sale_ID": None,
+        }
+
     def _to_dataframe(self) -> DataFrame:
-        return DataFrame(
-            [
-                {
-                    "Origin_ID": self.Origin_ID,
-                    "Disbursement_Date": self.Emission_Date,
-                    "First_Due_Date": self.Due_Date,
-                    "Capital_Requested": self.Capital_Requested,
-                    "Capital": self.Capital,
-                    "Credit_Type_ID": self.Credit_Type,
-                    "TNA_C_IVA": self.TNA_C_IVA,
-                    "Term": self.Term,
-                    "Client_ID": self.Client_ID,
-                    "Organism_ID": self.Organism_ID,
-                    "Purchase_ID": None,
-                    "Sale_ID": None,
-                }
-            ]
-        )
+        return DataFrame([self._to_dict()])
 
     def __init__(
         self,
@@ -44,55 +49,123 @@ class Credit:
         Organism: Organism | int | str,
         Term: int = 1,
         TNA_C_IVA: float = 0.0,
-        Emission_Date: str | datetime | Period = Period.now("D"),
+        Emission_Date: str | datetime | Period | None = None,
         Origin_ID: int | None = None,
     ):
+        self._create(
+            Due_Date,
+            Capital_Requested,
+            Capital,
+            Credit_Type,
+            search_client_id(Client),
+            search_organism_id(Organism),
+            Term,
+            TNA_C_IVA,
+            Emission_Date,
+            Origin_ID,
+        )
+
+    @classmethod
+    def from_ids(
+        cls,
+        Due_Date: str | datetime | Period,
+        Capital_Requested: float,
+        Capital: float,
+        Credit_Type: CreditTypes,
+        Client_ID: int,
+        Organism_ID: int | None,
+        Term: int = 1,
+        TNA_C_IVA: float = 0.0,
+        Emission_Date: str | datetime | Period | None = None,
+        Origin_ID: int | None = None,
+    ) -> "Credit":
+        """
+        Same as `Credit(...)` for a client and organism already resolved to
+        their IDs (e.g. once per batch), skipping the `search_*` lookups.
+        """
+        credit = cls.__new__(cls)
+        credit._create(
+            Due_Date,
+            Capital_Requested,
+            Capital,
+            Credit_Type,
+            Client_ID,
+            Organism_ID,
+            Term,
+            TNA_C_IVA,
+            Emission_Date,
+            Origin_ID,
+        )
+        return credit
+
+    def _create(
+        self,
+        Due_Date: str | datetime | Period,
+        Capital_Requested: float,
+        Capital: float,
+        Credit_Type: CreditTypes,
+        Client_ID: int,
+        Organism_ID: int | None,
+        Term: int,
+        TNA_C_IVA: float,
+        Emission_Date: str | datetime | Period | None,
+        Origin_ID: int | None,
+    ) -> None:
         table = "credits"
 
         self.Origin_ID = Origin_ID
-        self.Emission_Date = Period(Emission_Date, freq="D")
+        # Resolved per call: a default in the signature would freeze the date
+        self.Emission_Date = (
+            today() if Emission_Date is None else Period(Emission_Date, freq="D")
+        )
         self.Due_Date = Period(Due_Date, freq="D")
         self.Capital_Requested = Capital_Requested
         self.Capital = Capital
-        df_credit_types = read_table("credit_types", "Name")
-        self.Credit_Type = df_credit_types.at[Credit_Type, "ID"]
+        self.Credit_Type = cached_ids("credit_types", "Name")[Credit_Type]
         self.TNA_C_IVA = TNA_C_IVA
         self.Term = Term
-        self.Client_ID = search_client_id(Client)
-        self.Organism_ID = search_organism_id(Organism)
+        self.Client_ID = Client_ID
+        self.Organism_ID = Organism_ID
 
-        df = read_table(table)
-        if (Origin_ID is None) or (Origin_ID not in df.index.values):
-            df = self._to_dataframe()
-            write_table(df, table)
-            df = read_table(table)
-            self.ID = int(df.index.values.max())
-            _log(f"✅ Credit created with ID {self.ID:08d}.", log)
-        else:
-            mask = (df["Origin_ID"] == Origin_ID) & (
-                df["Client_ID"] == self.Organism_ID
+        # Existence check in SQL (only the ID travels over the wire)
+        credit_id = (
+            None
+            if Origin_ID is None
+            else exists_id(
+                table, Origin_ID=str(Origin_ID), Organism_ID=self.Organism_ID
             )
-            df = df.loc[mask]
-            if df.empty:
-                raise ValueError(
-                    f"❌ Credit with Origin_ID {self.Origin_ID} and Organism_ID {self.Organism_ID:03d} not found."
-                )
-            elif len(df) > 1:
-                raise ValueError(
-                    f"❌ Multiple credits with Origin_ID {self.Origin_ID} and Organism_ID {self.Organism_ID} found."
-                )
+        )
+
+        # The credit and its installments are written in one transaction, so
+        # they commit together (and only once)
+        with get_engine().begin() as conn:
+            if credit_id is None:
+                # One prepared INSERT returning the new ID: no one-row
+                # DataFrame to build and infer dtypes for
+                self.ID = insert_row(table, conn, **self._to_dict())
+                _log(f"✅ Credit created with ID {self.ID:08d}.", log)
             else:
-                self.ID = int(df.index.values[0])
+                self.ID = credit_id
                 _log(
                     f"✅ Credit with Origin_ID {self.Origin_ID} and Organism_ID {self.Organism_ID} found with ID {self.ID:08d}.",
                     log,
                 )
 
-        df_inst = DataFrame(
-            [Installment(self.ID, i)._to_dict() for i in range(1, self.Term + 1)]
-        )
-        df_inst.set_index("Inst_Num", inplace=True)
-        self.Installments = df_inst
+            # Every installment is computed and written in a single batch,
+            # from the terms already known here
+            self.Installments = create_installments(
+                self.ID,
+                cap=self.Capital,
+                tna=self.TNA_C_IVA,
+                term=self.Term,
+                credit_type_name=Credit_Type,
+                first_due_date=self.Due_Date,
+                conn=conn,
+            )
+
+        # Committed: the memoized copies of both tables are now stale
+        invalidate_table(table)
+        invalidate_table("installments")
 
     def __str__(self) -> str:
         return (
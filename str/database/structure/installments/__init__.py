@@ -1,3 +1,6 @@
-from str.database.structure.installments.main import Installment
+from str.database.structure.installments.main import (
+    Installment,
+    create_installments,
+)
 
-__all__ = ["Installment"]
+__all__ = ["Installment", "create_installments"]
@@ -1,11 +1,13 @@
-from pandas import DataFrame, Period
+from pandas import DataFrame, Period, Series
+from sqlalchemy.engine import Connection
 
-from str.database.connection import read_table, write_table
-from str.database.structure.installments.tools import (
-    inst_french,
-    inst_german,
-    inst_penalty,
+from str.database.connection import (
+    exists_id,
+    insert_row,
+    read_table,
+    write_table,
 )
+from str.database.structure.installments.tools import inst_schedule
 from str.tool import _log, log
 
 
@@ -26,71 +28,95 @@ class Installment:
     def _to_dataframe(self) -> DataFrame:
         return DataFrame([self._to_dict()])
 
-    def __init__(self, Credit_ID: int, i: int):
-        df_crts = read_table("credits")
-        df_crtp = read_table("credit_types")
-        data = df_crts.loc[Credit_ID]
-        cap = float(data["Capital"])  # type: ignore
-        tna = float(data["TNA_C_IVA"])  # type: ignore
-        term = int(data["Term"])  # type: ignore
-        id_credit_type = int(data["Credit_Type_ID"])  # type: ignore
-        first_due_date = Period(data["First_Due_Date"], freq="M")  # type: ignore
-        df = []
-        if df_crtp.at[id_credit_type, "Name"] == "FRANCES":
-            self = inst_french(
-                self,
-                Credit_ID=Credit_ID,
-                cap=cap,
-                tna=tna,
-                term=term,
-                i=i,
-                first_due_date=first_due_date,
-            )
-        elif df_crtp.at[id_credit_type, "Name"] == "ALEMAN":
-            self = inst_german(
-                self,
-                cap=cap,
-                tna=tna,
-                term=term,
-                i=i,
-                first_due_date=first_due_date,
-                Credit_ID=Credit_ID,
-            )
-        elif df_crtp.at[id_credit_type, "Name"] == "PENALTY":
-            self = inst_penalty(
-                self,
-                cap=cap,
-                i=i,
-                first_due_date=first_due_date,
-                Credit_ID=Credit_ID,
-            )
-        else:
-            raise ValueError(
-                f"❌ Credit Type {df_crtp.at[id_credit_type, 'Name']} not implemented."
-            )
+    def __init__(
+        self,
+        Credit_ID: int,
+        i: int,
+        *,
+        cap: float,
+        tna: float,
+        term: int,
+        credit_type_name: str,
+        first_due_date: Period,
+        save: bool = True,
+    ):
+        # The credit's terms come from the caller, which already has them,
+        # instead of being read back from the credits table; the row is taken
+        # from the same schedule create_installments() writes
+        if not 1 <= i <= term:
+            raise ValueError(f"❌ Installment {i} out of range for a term of {term}.")
+        row = inst_schedule(
+            credit_type_name,
+            Credit_ID,
+            cap,
+            tna,
+            term,
+            Period(first_due_date, freq="M"),
+        ).iloc[i - 1]
+        for col, value in row.items():
+            setattr(self, col, value)
+
+        # Only compute the installment
+        if not save:
+            self.ID = None
+            return
 
-        df = read_table("installments")
-        if (Credit_ID in df["Credit_ID"].values) and (
-            i in df.loc[(df["Credit_ID"] == Credit_ID), "Inst_Num"].values
-        ):
-            mask = (df["Credit_ID"] == Credit_ID) & (df["Inst_Num"] == i)
-            df_exist = df.loc[mask]
-            if df_exist.empty:
-                raise ValueError(
-                    f"❌ Installment {i} for Credit_ID {Credit_ID} not found in database."
-                )
-            elif len(df_exist) > 1:
-                raise ValueError(
-                    f"❌ Multiple installments {i} for Credit_ID {Credit_ID} found in database."
-                )
-            else:
-                self.ID = int(df_exist.index.values[0])
-        else:
-            df = self._to_dataframe()
-            write_table(df, "installments")
-            df = read_table("installments")
-            self.ID = int(df.index.values.max())
+        # Existence check in SQL (only the ID travels over the wire)
+        self.ID = exists_id("installments", Credit_ID=Credit_ID, Inst_Num=i)
+        if self.ID is None:
+            # The INSERT returns the new ID: no lookup after writing
+            self.ID = insert_row("installments", **self._to_dict())
             _log(
                 f"✅ Installment {i:02d} of {term:02d} for Credit_ID {Credit_ID:08d} created with ID {self.ID}.",
                 log,
             )
+
+
+def create_installments(
+    Credit_ID: int,
+    *,
+    cap: float,
+    tna: float,
+    term: int,
+    credit_type_name: str,
+    first_due_date: Period,
+    conn: Connection | None = None,
+) -> DataFrame:
+    """
+    Compute every installment of a credit (vectorized, see `inst_schedule`)
+    and write the ones missing from the database in a single INSERT (instead
+    of one read and one write per installment). Returns the installments
+    with their ID, indexed by Inst_Num. The INSERT joins `conn`'s
+    transaction if given (the caller invalidates "installments" after it
+    commits).
+    """
+    # The whole amortization schedule, computed with one array per column
+    df = inst_schedule(
+        credit_type_name,
+        Credit_ID=Credit_ID,
+        cap=cap,
+        tna=tna,
+        term=term,
+        first_due_date=Period(first_due_date, freq="M"),
+    )
+
+    # Installments of this credit already in the database: ID by Inst_Num
+    df_db = read_table("installments", where={"Credit_ID": Credit_ID})
+    existing = Series(df_db.index, index=df_db["Inst_Num"].to_numpy())
+    if existing.index.duplicated().any():
+        raise ValueError(
+            f"❌ Multiple installments for Credit_ID {Credit_ID} found in database."
+        )
+
+    df["ID"] = df["Inst_Num"].map(existing)
+    new = df["ID"].isna().to_numpy()
+    if new.any():
+        ids = write_table(df.loc[new].drop(columns="ID"), "installments", conn)
+        df.loc[new, "ID"] = ids.to_numpy()
+        _log(
+            f"✅ {new.sum():02d} installments of {term:02d} for Credit_ID {Credit_ID:08d} created.",
+            log,
+        )
+    df["ID"] = df["ID"].astype("int64")
+
+    return df.set_index("Inst_Num")
@@ -1,85 +1,98 @@
-from numpy_financial import ipmt, pmt, ppmt
-from pandas import Period
+from functools import lru_cache
+
+import numpy as np
+from pandas import DataFrame, Period, PeriodIndex
 
 from str.constants import OUR_COMPANY_ID
 
 
-def inst_french(
-    self,
-    Credit_ID: int,
-    cap: float,
-    tna: float,
-    term: int,
-    i: int,
-    first_due_date: Period,
-):
-    inst_value = pmt(rate=tna / 365 * 30, nper=term, pv=-cap)
-    inst_cap = ppmt(rate=tna / 365 * 30, per=i, nper=term, pv=-cap)
-    inst_int = ipmt(rate=tna / 365 * 30, per=i, nper=term, pv=-cap) / 1.21
+# ---------- Whole schedules (one array per column) ----------
+def _french_vec(cap: float, tna: float, term: int):
+    # Closed form of pmt/ppmt/ipmt: the capital share of each installment
+    # grows geometrically, so the whole schedule is one power per element
+    rate = tna / 365 * 30
+    per = np.arange(1, term + 1)
+    if rate == 0:
+        value = cap / term
+        inst_cap = np.full(term, value)
+    else:
+        growth = (1 + rate) ** term
+        value = cap * rate * growth / (growth - 1)
+        inst_cap = value * (1 + rate) ** (per - term - 1.0)
+    inst_value = np.full(term, value)
+    inst_int = (inst_value - inst_cap) / 1.21
     inst_iva = inst_value - (inst_cap + inst_int)
-    vto_date = Period(first_due_date + (i - 1))
-    vto_date = Period(f"{vto_date.year}/{vto_date.month}/28", freq="D")
-    self.Credit_ID = Credit_ID
-    self.Inst_Num = i
-    self.Owner_ID = OUR_COMPANY_ID
-    self.Due_Date = vto_date
-    self.Capital = inst_cap
-    self.Interest = inst_int
-    self.IVA = inst_iva
-    self.Total = inst_value
-    self.Settlement_Date = vto_date
-
-    return self
-
-
-def inst_german(
-    self,
-    cap: float,
-    tna: float,
-    term: int,
-    i: int,
-    first_due_date: Period,
-    Credit_ID: int,
-):
-    inst_cap = cap / term
-    inst_int = (cap - inst_cap * (i - 1)) * (tna / 365 * 30) / 1.21
+    return inst_cap, inst_int, inst_iva, inst_value
+
+
+def _german_vec(cap: float, tna: float, term: int):
+    per = np.arange(1, term + 1)
+    inst_cap = np.full(term, cap / term)
+    inst_int = (cap - inst_cap * (per - 1)) * (tna / 365 * 30) / 1.21
     inst_iva = inst_int * 0.21
     inst_value = inst_cap + inst_int + inst_iva
-    vto_date = Period(first_due_date + (i - 1))
-    vto_date = Period(f"{vto_date.year}/{vto_date.month}/28", freq="D")
-    self.Credit_ID = Credit_ID
-    self.Inst_Num = i
-    self.Owner_ID = OUR_COMPANY_ID
-    self.Due_Date = vto_date
-    self.Capital = inst_cap
-    self.Interest = inst_int
-    self.IVA = inst_iva
-    self.Total = inst_value
-    self.Settlement_Date = vto_date
-
-    return self
-
-
-def inst_penalty(
-    self,
+    return inst_cap, inst_int, inst_iva, inst_value
+
+
+def _penalty_vec(cap: float, tna: float, term: int):
+    inst_cap = np.zeros(term)
+    inst_int = np.full(term, cap / 1.21)
+    inst_iva = cap - inst_int
+    inst_value = np.full(term, cap)
+    return inst_cap, inst_int, inst_iva, inst_value
+
+
+SCHEDULES = {"FRANCES": _french_vec, "ALEMAN": _german_vec, "PENALTY": _penalty_vec}
+
+
+@lru_cache(maxsize=256)
+def _unit_schedule(credit_type: str, tna: float, term: int) -> tuple[np.ndarray, ...]:
+    # Schedule for a capital of $1, shared by every credit with the same
+    # (type, rate, term); read-only because the cached arrays are reused
+    columns = SCHEDULES[credit_type](1.0, tna, term)
+    for column in columns:
+        column.setflags(write=False)
+    return columns
+
+
+def inst_schedule(
+    credit_type: str,
+    Credit_ID: int,
     cap: float,
-    i: int,
+    tna: float,
+    term: int,
     first_due_date: Period,
-    Credit_ID: int,
-):
-    inst_cap = 0.0
-    inst_int = cap / 1.21
-    inst_iva = cap - inst_int
-    inst_value = cap
-    vto_date = Period(first_due_date + (i - 1))
-    vto_date = Period(f"{vto_date.year}/{vto_date.month}/28", freq="D")
-    self.Credit_ID = Credit_ID
-    self.Inst_Num = i
-    self.Owner_ID = OUR_COMPANY_ID
-    self.Due_Date = vto_date
-    self.Capital = inst_cap
-    self.Interest = inst_int
-    self.IVA = inst_iva
-    self.Total = inst_value
-    self.Settlement_Date = vto_date
-    return self
+) -> DataFrame:
+    """
+    Every installment of a credit at once (French, German or penalty
+    schedule), as `installments` rows. Also the source of single
+    `Installment` rows, so there is one schedule implementation.
+    """
+    if credit_type not in SCHEDULES:
+        raise ValueError(f"❌ Credit Type {credit_type} not implemented.")
+    # Every schedule is linear in the capital: scale the one for $1
+    inst_cap, inst_int, inst_iva, inst_value = (
+        cap * column for column in _unit_schedule(credit_type, tna, term)
+    )
+
+    # Day 28 of each month, by integer month math (months since 1970-01)
+    first_month = Period(first_due_date, freq="M")
+    month0 = (first_month.year - 1970) * 12 + first_month.month - 1
+    months = (month0 + np.arange(term)).astype("datetime64[M]")
+    vto_dates = PeriodIndex(months.astype("datetime64[D]") + 27, freq="D")
+
+    # Built column-wise from typed arrays; they are fresh, so no copy
+    return DataFrame(
+        {
+            "Credit_ID": np.full(term, Credit_ID, dtype=np.int64),
+            "Inst_Num": np.arange(1, term + 1, dtype=np.int64),
+            "Owner_ID": np.full(term, OUR_COMPANY_ID),
+            "Due_Date": vto_dates,
+            "Capital": inst_cap,
+            "Interest": inst_int,
+            "IVA": inst_iva,
+            "Total": inst_value,
+            "Settlement_Date": vto_dates,
+        },
+        copy=False,
+    )
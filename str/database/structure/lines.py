@@ -1,8 +1,8 @@
 from pandas import DataFrame
 
-from str.database.connection import read_table, write_table
+from str.database.connection import cached_ids, cached_lookup, exists_id, insert_row
 from str.database.structure.clients.tool import validate_cuil
-from str.tool import _log, log, validate_email
+from str.tool import _log, log, normalize_name, validate_email
 
 
 class Line:
@@ -22,24 +22,23 @@ class Line:
         self, name: str, cuit: str, abbreviation: str, email: str | None = None
     ):
         table = "business_lines"
-        self.name = str(name).upper().strip()
+        self.name = normalize_name(name)
         self.CUIT = validate_cuil(cuit)
-        self.abbreviation = str(abbreviation).upper().strip()
+        self.abbreviation = normalize_name(abbreviation)
         self.email = validate_email(email)
         self.active = True
 
-        df = read_table(table, "CUIT")
-        if self.CUIT in df.index.values:
+        # Existence check in SQL (only the ID travels over the wire)
+        line_id = exists_id(table, CUIT=str(self.CUIT))
+        if line_id is not None:
             print("Codear la actualización!!!!")
             _log(f"✅ The CUIT {self.CUIT} already in the database.\n", log)
+            self.ID = line_id
         else:
-            df = self._to_dataframe()
-            write_table(df, table)
-            df = read_table(table, "CUIT")
+            # The INSERT returns the new ID: no DataFrame round trip
+            self.ID = insert_row(table, **self._to_dict())
             _log("    ✅ The new business line is added to the database.\n", log)
 
-        self.ID = df.at[self.CUIT, "ID"]
-
     def __str__(self) -> str:
         return (
             f"💿 Line ID {self.ID:03d}:\n"
@@ -56,18 +55,19 @@ def search_line_id(line: str | int | Line) -> int:
     if isinstance(line, Line):
         return line.ID  # type: ignore
     elif isinstance(line, int):
-        df = read_table(table)
-        if line in df.index.values:
+        if line in cached_lookup(table, "Name"):
             return line
         else:
             raise ValueError(f"The Line ID {line} is not in the database.")
     elif isinstance(line, str):
-        df = read_table(table)
-        line = str(line).upper().strip()
-        if line in df["Name"].values:
-            return df.loc[df["Name"] == line].index.values[0]
-        elif line in df["Abbreviation"].values:
-            return df.loc[df["Abbreviation"] == line].index.values[0]
+        line = normalize_name(line)
+        # Memoized {name: ID} and {abbreviation: ID} dicts (hash lookups)
+        name_to_id = cached_ids(table, "Name")
+        abbr_to_id = cached_ids(table, "Abbreviation")
+        if line in name_to_id:
+            return name_to_id[line]
+        elif line in abbr_to_id:
+            return abbr_to_id[line]
         else:
             raise ValueError(f"The Line '{line}' is not in the database.")
     else:
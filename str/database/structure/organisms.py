@@ -1,9 +1,9 @@
 from pandas import DataFrame
 
-from str.database.connection import read_table, write_table
+from str.database.connection import cached_ids, cached_lookup, exists_id, insert_row
 from str.database.structure.clients.tool import validate_cuil
 from str.database.structure.lines import Line, search_line_id
-from str.tool import _log, log, validate_email
+from str.tool import _log, log, normalize_name, validate_email
 
 
 class Organism:
@@ -25,20 +25,20 @@ class Organism:
         Line: int | str | Line,
         Email: str | None = None,
     ) -> None:
-        self.Name = str(Name).upper().strip()
+        self.Name = normalize_name(Name)
         self.CUIT = validate_cuil(CUIT)
         self.Lien_ID = search_line_id(Line)
         self.Email = validate_email(Email)
 
         table = "organisms"
-        df = read_table("organisms")
-        if self.CUIT in df["CUIT"].values:
+        # Existence check in SQL, instead of copying the whole CUIT column
+        self.ID = exists_id(table, CUIT=str(self.CUIT))
+        if self.ID is not None:
             print("Codear la actualización!!!!")
             _log(f"✅ The CUIT {self.CUIT} already in the database.\n", log)
         else:
-            df_new = self._to_dataframe()
-            write_table(df_new, table)
-            df = read_table(table)
+            # The INSERT returns the new ID: no DataFrame round trip
+            self.ID = insert_row(table, **self._to_dict())
             _log("    ✅ The new organism is added to the database.\n", log)
 
     def __str__(self) -> str:
@@ -50,7 +50,30 @@ class Organism:
 
 
 def search_organism_id(organism: str | int | Organism | None) -> int | None:
+    table = "organisms"
     if organism is None:
         return None
+    elif isinstance(organism, Organism):
+        return organism.ID  # type: ignore
+    elif isinstance(organism, int):
+        # An organism ID, or else its CUIT
+        if organism in cached_lookup(table, "Name"):
+            return organism
+        cuit_to_id = cached_ids(table, "CUIT")
+        if organism in cuit_to_id:
+            return cuit_to_id[organism]
+        raise ValueError(f"The Organism ID/CUIT {organism} is not in the database.")
+    elif isinstance(organism, str):
+        name = normalize_name(organism)
+        # Memoized {name: ID} and {CUIT: ID} dicts (hash lookups)
+        name_to_id = cached_ids(table, "Name")
+        if name in name_to_id:
+            return name_to_id[name]
+        elif name.isdigit() and int(name) in cached_ids(table, "CUIT"):
+            return cached_ids(table, "CUIT")[int(name)]
+        else:
+            raise ValueError(f"The Organism '{name}' is not in the database.")
     else:
-        return 1
+        raise TypeError(
+            "The organism must be an Organism object, an integer ID/CUIT, or a string."
+        )
@@ -1,6 +1,6 @@
-from str.database.connection import read_table, write_table
+from str.database.connection import cached_ids, cached_lookup, exists_id, insert_row
 from str.database.structure.countries import Country
-from str.tool import _log, log
+from str.tool import _log, log, normalize_name
 
 
 class Province:
@@ -27,50 +27,38 @@ class Province:
         --------------------------------------------------------
         """
 
-        name = str(name).upper().strip()  # normalize province name
-        country = str(country).upper().strip()  # normalize country name
+        name = normalize_name(name)  # normalize province name
+        country = normalize_name(country)  # normalize country name
         table = "provinces"
 
         self.Name = name  # store province name
 
-        # Load existing provinces and countries
-        df = read_table(table)
-        df_country = read_table("countries", "Name")
-
         # ---------- COUNTRY HANDLING ----------
-        if country in df_country.index.values:
-            self.Country_ID = df_country.at[country, "ID"]  # existing country
+        country_ids = cached_ids("countries", "Name")
+        if country in country_ids:
+            self.Country_ID = country_ids[country]  # existing country
         else:
             new_country = Country(country)  # create new country
             self.Country_ID = new_country.ID  # assign new ID
 
+        # Existence check in SQL (only the ID travels over the wire)
+        province_id = exists_id(table, Name=name, Country_ID=self.Country_ID)
+
         # ---------- PROVINCE DOES NOT EXIST ----------
-        if name not in df.loc[df["Country_ID"] == self.Country_ID, "Name"].values:
+        if province_id is None:
             _log("\n✏️ Adding a new province...", log)
 
-            df = df.iloc[0:0]  # empty df to insert row
-            df.loc[0] = {
-                "Name": self.Name,
-                "Country_ID": self.Country_ID,  # FK to countries table
-            }
-
-            write_table(df, table)
+            self.ID = insert_row(  # the INSERT returns the Province ID
+                table,
+                Name=self.Name,
+                Country_ID=self.Country_ID,  # FK to countries table
+            )
             _log(f"    ✅ {name} added to the database.\n", log)
 
         # ---------- PROVINCE ALREADY EXISTS ----------
         else:
             _log(f"✅ {name} already in the database.\n", log)
-
-        # Load indexed by Name for fast lookup
-        df = read_table(table, "Name")
-        mask = (df.index == self.Name) & (df["Country_ID"] == self.Country_ID)
-
-        if len(df.loc[mask, "ID"]) == 1:
-            self.ID = df.loc[mask, "ID"].values[0]  # assign Province ID
-        else:
-            raise ValueError(
-                f"More than one province named {self.Name} in the country {country}"
-            )
+            self.ID = province_id  # assign Province ID
 
     def __str__(self):
         """
@@ -82,8 +70,7 @@ class Province:
         --------------------------------------------------------
         """
 
-        df_countries = read_table("countries")  # load for lookup
-        country_name = df_countries.at[self.Country_ID, "Name"]  # type: ignore
+        country_name = cached_lookup("countries", "Name")[self.Country_ID]
         try:
             return (
                 f"\nℹ️ Province ID: {self.ID:03d}\n"
@@ -1,7 +1,5 @@
 # database/create.py.py
 
-from pandas import Period
-
 from str.database.structure import (
     City,
     Client,
@@ -12,7 +10,7 @@ from str.database.structure import (
     Line,
     Organism,
 )
-from str.tool import _log, log
+from str.tool import _log, day_period, log, today
 
 new_client = Client(
     "Carini",
@@ -43,35 +41,36 @@ new_phone = ClientPhones(
 
 new_line = Line(
     "Mutual Inventada",
-    "30-56125789-8",
+    "30-56125789-9",
     "MI",
     "mutual_inventada@inventada.com",
 )
 
-new_org = Organism("Este Organismo", "20-12345678-9", "MI", "org@mutual.com")
+new_org = Organism("Este Organismo", "20-12345678-6", "MI", "org@mutual.com")
 
-new_credit = Credit(
-    Due_Date=Period("2026/01/28", freq="D"),
+# Client and organism are resolved above: the credits reuse their IDs
+new_credit = Credit.from_ids(
+    Due_Date=day_period(2026, 1, 28),
     Capital_Requested=100000.0,
     Capital=95000.0,
     Credit_Type="FRANCES",
-    Client=36329758,
-    Organism="MI",
+    Client_ID=new_client.ID,
+    Organism_ID=new_org.ID,
     Term=12,
     TNA_C_IVA=1.3,
-    Emission_Date=Period.now("D"),
+    Emission_Date=today(),
 )
 _log("\n", log)
 
-new_credit = Credit(
-    Due_Date=Period("2026/04/28", freq="D"),
+new_credit = Credit.from_ids(
+    Due_Date=day_period(2026, 4, 28),
     Capital_Requested=1000000.0,
     Capital=100000.0,
     Credit_Type="FRANCES",
-    Client=36329758,
-    Organism="MI",
+    Client_ID=new_client.ID,
+    Organism_ID=new_org.ID,
     Term=18,
     TNA_C_IVA=1.45,
-    Emission_Date=Period("2026/02/01", "D"),
+    Emission_Date=day_period(2026, 2, 1),
 )
 _log("\n", log)
@@ -10,9 +10,6 @@
 #   • Integrate file choosing into higher-level workflows
 # ------------------------------------------------------------
 
-import tkinter as tk
-from tkinter import filedialog  # Windows-native "Open File" and "Save File" dialogs
-
 
 def select_file():
     """
@@ -24,6 +21,10 @@ def select_file():
     windows.
     ------------------------------------------------------------
     """
+    # Tk is imported here, so importing str.io does not load it
+    import tkinter as tk
+    from tkinter import filedialog  # Windows-native "Open File" dialogs
+
     # Create a hidden root window
     root = tk.Tk()
     root.withdraw()
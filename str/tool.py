@@ -1,6 +1,23 @@
 # tool.py
+import re
+from datetime import date as _date
+from datetime import datetime
+from functools import lru_cache
+
+from pandas import Period, Series
+
 log = False
 
+# ASCII non-digits, deleted in one C-level pass by str.translate; anything
+# non-ASCII left over (rare separators like "–") falls back to the regex
+ASCII_NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not chr(i).isdigit())
+)
+NON_DIGITS = re.compile(r"\D")
+
+# E-mail addresses (upper case), shared with the Email class
+EMAIL_RE = re.compile(r"^[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}$")
+
 
 def _log(text, outputs: bool = True):
     if outputs:
@@ -8,10 +25,50 @@ def _log(text, outputs: bool = True):
 
 
 def validate_email(email: str | None) -> str | None:
-    if email is None or str(email).strip() == "":
+    if email is None:
+        return None
+    email = str(email).strip()
+    if email == "":
         return None
-    elif "@" not in email or ".com" not in email:
+    elif EMAIL_RE.match(email.upper()) is None:
         raise ValueError(f"Invalid email address: {email}")
     else:
-        email = email.strip()
         return email
+
+
+def normalize_name(value) -> str:
+    """Normalize a name the way it is stored in the database (trimmed, upper case)."""
+    return str(value).strip().upper()
+
+
+def normalize_names(names: Series) -> Series:
+    """`normalize_name` over a whole column, with pandas string methods."""
+    return names.astype(str).str.strip().str.upper()
+
+
+def digits_only(value) -> str:
+    """Keep only the digits of a document ('20-36329758-8' → '20363297588')."""
+    digits = str(value).translate(ASCII_NON_DIGITS)
+    return digits if digits.isascii() else NON_DIGITS.sub("", digits)
+
+
+def as_period(date: str | datetime | Period) -> Period:
+    """Normalize a date to a daily Period, reusing it if it already is one."""
+    if isinstance(date, Period) and date.freqstr == "D":
+        return date
+    return Period(date, "D")
+
+
+def day_period(year: int, month: int, day: int) -> Period:
+    """Daily Period built from its fields (no string parsing)."""
+    return Period(year=year, month=month, day=day, freq="D")
+
+
+@lru_cache(maxsize=1)
+def _today(ordinal: int) -> Period:
+    return Period(_date.fromordinal(ordinal), "D")
+
+
+def today() -> Period:
+    """Today's date as a daily Period, built once per calendar day."""
+    return _today(_date.today().toordinal())
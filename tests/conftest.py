@@ -0,0 +1,28 @@
+import sys
+import types
+
+import pytest
+from pandas import DataFrame, Index
+
+pytest.importorskip("sqlalchemy")
+
+from str.database import connection
+
+# The collections modules read these at import time; seeding the memoized
+# copies lets them be imported (and tested) without a database
+COLLECTION_TYPES = ["COMUN", "PENALTY", "REDONDEO", "ANTICIPADA", "BONIFICACION"]
+
+df_coll_type = DataFrame(
+    {"Type": COLLECTION_TYPES},
+    index=Index(range(1, len(COLLECTION_TYPES) + 1), name="ID", dtype="Int32"),
+)
+connection._TABLE_CACHE[("collection_types", "ID")] = df_coll_type
+connection._TABLE_CACHE[("collection_types", "Type")] = (
+    df_coll_type.reset_index().set_index("Type")
+)
+
+# str.constants queries business_partners when imported
+constants = types.ModuleType("str.constants")
+constants.first_bp_id = 1
+constants.OUR_COMPANY_ID = 1
+sys.modules.setdefault("str.constants", constants)
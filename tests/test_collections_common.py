@@ -0,0 +1,58 @@
+import pytest
+from pandas import DataFrame, Period
+
+from str.collections import common
+
+
+@pytest.fixture
+def df_balance(monkeypatch):
+    # Two pending installments of one credit, $ 300 in total
+    df = DataFrame(
+        {
+            "Credit_ID": [7, 7],
+            "Inst_Num": [1, 2],
+            "Due_Date": [Period("2026-01-28", "D"), Period("2026-02-28", "D")],
+            "Capital": [80.0, 80.0],
+            "Interest": [50.0, 50.0],
+            "IVA": [20.0, 20.0],
+            "Total": [150.0, 150.0],
+        },
+        index=[11, 12],
+    ).rename_axis("ID")
+    monkeypatch.setattr(common, "get_client_balance_by_document", lambda *args: df)
+    return df
+
+
+def test_document_overpaying_single_credit_penalizes_only_the_surplus(
+    monkeypatch, df_balance
+):
+    penalties = []
+
+    def fake_penalty(credit_id, amount, date=None):
+        penalties.append((credit_id, amount))
+        return DataFrame({"Credit_ID": [credit_id], "Total": [amount]}, index=[99])
+
+    monkeypatch.setattr(common, "penalty", fake_penalty)
+    monkeypatch.setattr(common, "basic_formatting", lambda df, date: df)
+    monkeypatch.setattr(common, "_save", lambda df, date, save, _round: df)
+    monkeypatch.setattr(common, "extra_formatting", lambda df: df)
+    monkeypatch.setattr(common, "round_balance", lambda date: None)
+
+    df = common.document(
+        36329758, "DNI", "COMUN", 350.0, Period("2026-03-01", "D"), save=True
+    )
+
+    # The penalty is for the $ 50 over the balance, not the whole payment
+    assert penalties == [(7, 50.0)]
+    assert df["Total"].sum() == pytest.approx(350.0)
+
+
+def test_document_overpaying_single_credit_preview(df_balance):
+    # Without saving no penalty is created: only the balance is collected
+    df = common.document(
+        36329758, "DNI", "COMUN", 350.0, Period("2026-03-01", "D"), save=False
+    )
+
+    assert df["Installment_ID"].tolist() == [11, 12]
+    assert df["Type"].astype(str).tolist() == ["COMUN", "COMUN"]
+    assert df["Total"].sum() == pytest.approx(300.0)
@@ -0,0 +1,32 @@
+import pytest
+from pandas import DataFrame, Series
+
+from str.collections import tools
+
+
+@pytest.fixture
+def df_installments():
+    # A negative Total makes the running total non-monotonic
+    return DataFrame(
+        {
+            "Credit_ID": [7, 7, 7, 7],
+            "Capital": [50.0, 50.0, 50.0, 50.0],
+            "Total": [100.0, -50.0, 100.0, 30.0],
+        },
+        index=[1, 2, 3, 4],
+    ).rename_axis("ID")
+
+
+@pytest.mark.parametrize("amount", [60.0, 160.0])
+def test_split_paths_agree_on_non_monotonic_totals(df_installments, amount):
+    df_up, df_down, surplus = tools.split(df_installments, amount, 1)
+    first_up, next_inst, first_surplus = tools.split_first(df_installments, amount, 1)
+    batch_up, _, batch_surplus = tools.split_batch(
+        df_installments, Series({7: amount}), 1
+    )
+
+    assert df_up["ID"].tolist() == first_up["ID"].tolist()
+    assert df_up["ID"].tolist() == batch_up["ID"].tolist()
+    assert next_inst.index.tolist() == df_down["ID"].tolist()[:1]
+    assert surplus == pytest.approx(first_surplus)
+    assert surplus == pytest.approx(batch_surplus[7])